@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Import time and modules loaded by the package
+
+Imports the package in a fresh interpreter (several times) and reports
+the minimum wall time as well as the heavy modules loaded. Exits with a
+non-zero status if one of the checks fails such that it can be used in
+scripts (e.g., CI).
+
+Checks:
+    import polarchart                      no numpy, pandas, matplotlib, colorspace
+    from polarchart import get_demodata    no matplotlib, colorspace
+    from polarchart import radar           no matplotlib.pyplot, colorspace
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 10 --max-ms 50
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+ROOT  = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+HEAVY = ["numpy", "pandas", "matplotlib", "matplotlib.pyplot", "colorspace"]
+
+# Statement and modules which must not be loaded afterwards
+CHECKS = [("import polarchart",                   HEAVY),
+          ("from polarchart import get_demodata", ["matplotlib", "colorspace"]),
+          ("from polarchart import radar",        ["matplotlib.pyplot", "colorspace"])]
+
+# Executed in a fresh interpreter; prints time (seconds) and modules as JSON
+SCRIPT = """
+import sys, json, time
+sys.path.insert(0, {root!r})
+t = time.perf_counter()
+{stmt}
+t = time.perf_counter() - t
+print(json.dumps(dict(seconds = t, modules = [m for m in {heavy!r} if m in sys.modules])))
+"""
+
+
+def run(stmt, repeat = 5):
+    """Minimum import time (seconds) of `repeat` fresh interpreters and
+    the heavy modules loaded."""
+    best = None
+    for i in range(repeat):
+        out = subprocess.run([sys.executable, "-c", SCRIPT.format(root = ROOT, stmt = stmt, heavy = HEAVY)],
+                             capture_output = True, text = True, check = True).stdout
+        res = json.loads(out)
+        if best is None or res["seconds"] < best["seconds"]: best = res
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Import time and modules loaded")
+    parser.add_argument("--repeat", type = int, default = 5)
+    parser.add_argument("--max-ms", type = float, default = None,
+                        help = "fail if 'import polarchart' takes longer (milliseconds)")
+    args = parser.parse_args()
+
+    failed = False
+    for stmt, forbidden in CHECKS:
+        res = run(stmt, args.repeat)
+        bad = [m for m in forbidden if m in res["modules"]]
+        if stmt == "import polarchart" and args.max_ms is not None:
+            bad += [f"{res['seconds'] * 1e3:.1f}ms > {args.max_ms}ms"] if res["seconds"] * 1e3 > args.max_ms else []
+        failed = failed or len(bad) > 0
+        print(f"{stmt:<40} {res['seconds'] * 1e3:>8.1f}ms  loaded: {', '.join(res['modules']) or '-'}"
+              + (f"  FAILED: {', '.join(bad)}" if bad else ""))
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
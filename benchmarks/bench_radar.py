@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the radar pipeline
+
+Times the individual stages of the radar pipeline on synthetic data for
+a grid of row and column counts without requiring a display (Agg backend).
+Results are written as JSON and can be compared between commits.
+
+Stages:
+    prepare    utils.prepare_num_df()
+    scale      utils.scale_df()
+    layout     utils.get_gridsize()
+    geometry   geometry.calc_radar_verts()
+    artists    creation of the artists only (phase "artists" of
+               RenderStats, excludes preparation, layout, and geometry)
+    draw       canvas.draw() (Agg)
+    savefig    savefig() to an in-memory PNG
+
+The stages 'artists', 'draw', and 'savefig' are run with the default
+options of radar() (one Text per ring label and chart) and again with
+'fast_labels = True, ring_labels = "legend"' (suffix '_fast').
+
+Usage:
+    python benchmarks/bench_radar.py --quick
+    python benchmarks/bench_radar.py --rows 10 1000 100000 --cols 3 12 200 \\
+        --output bench_<commit>.json
+    python benchmarks/bench_radar.py --compare bench_old.json bench_new.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+
+import matplotlib
+matplotlib.use("Agg")
+
+# Use the package from this repository (not an installed version)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+import pandas as pd
+
+ROWS   = [10, 100, 1000, 10000, 100000]
+COLS   = [3, 12, 50, 200]
+STAGES = ["prepare", "scale", "layout", "geometry", "artists", "draw", "savefig",
+          "artists_fast", "draw_fast", "savefig_fast"]
+
+# Options of radar() benchmarked (suffix of the stages)
+OPTIONS = {"":      dict(),
+           "_fast": dict(fast_labels = True, ring_labels = "legend")}
+
+
+def synthetic_df(nrow, ncol, seed = 1):
+    """Synthetic data set with a label column and `ncol` numeric columns"""
+    rng = np.random.default_rng(seed)
+    df  = pd.DataFrame(rng.gamma(2., 2., size = (nrow, ncol)),
+                       columns = [f"var{i:03d}" for i in range(ncol)])
+    df.insert(0, "label", [f"row{i}" for i in range(nrow)])
+    return df
+
+
+def timeit(fun, repeat):
+    """Minimum wall time (seconds) of `repeat` calls; returns the time
+    and the result of the last call."""
+    best = np.inf
+    for i in range(repeat):
+        t   = time.perf_counter()
+        res = fun()
+        best = min(best, time.perf_counter() - t)
+    return best, res
+
+
+def bench_one(nrow, ncol, repeat = 3, max_draw_cells = 1e6, figsize = (10, 10)):
+    """Benchmark all stages for one data set
+
+    Returns:
+        dict: Stage name and time in seconds (`None` if skipped).
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from io import BytesIO
+    from polarchart import radar, RenderStats
+    from polarchart.utils import prepare_num_df, scale_df, get_gridsize, axis_get_size
+    from polarchart.geometry import calc_radar_verts
+
+    raw = synthetic_df(nrow, ncol)
+    res = dict.fromkeys(STAGES)
+
+    res["prepare"], (_, df) = timeit(lambda: prepare_num_df(raw.copy(deep = False), "label"), repeat)
+    df = df.astype(float)
+    res["scale"], df = timeit(lambda: scale_df(df), repeat)
+    axsize = axis_get_size(Figure(figsize = figsize).subplots()) # (height, width)
+    res["layout"], (nr, nc) = timeit(lambda: get_gridsize(axsize, None, nrow + 1), repeat)
+
+    idx     = np.arange(nrow)
+    centers = np.column_stack([idx % nc, idx // nc])
+    values  = df.to_numpy()
+    res["geometry"], _ = timeit(lambda: calc_radar_verts(values, centers, 0.4, 1.), repeat)
+
+    # Drawing very large grids is skipped (see --max-draw-cells)
+    if nrow * ncol > max_draw_cells:
+        return res
+
+    # Only the time spent creating the artists is taken (minimum over
+    # the repetitions), see RenderStats.
+    for suffix, options in OPTIONS.items():
+        best = np.inf
+        for i in range(repeat):
+            fig   = Figure(figsize = figsize)
+            stats = RenderStats()
+            radar(df, ax = fig.subplots(), scale = False, xmax = 1, stats = stats, **options)
+            best  = min(best, stats.phases["artists"])
+        res["artists" + suffix] = best
+
+        canvas = FigureCanvasAgg(fig)
+        res["draw" + suffix], _ = timeit(canvas.draw, repeat)
+        res["savefig" + suffix], _ = timeit(lambda: fig.savefig(BytesIO(), format = "png"), repeat)
+
+    return res
+
+
+def metadata():
+    """Information to identify the run (commit, versions, platform)"""
+    import matplotlib
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                capture_output = True, text = True,
+                                cwd = os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except Exception:
+        commit = None
+    return dict(commit = commit or None,
+                time = time.strftime("%Y-%m-%dT%H:%M:%S"),
+                python = platform.python_version(),
+                platform = platform.platform(),
+                numpy = np.__version__,
+                pandas = pd.__version__,
+                matplotlib = matplotlib.__version__)
+
+
+def compare(old, new):
+    """Print the ratio new/old for all stages found in both files"""
+    with open(old) as fid: old = json.load(fid)
+    with open(new) as fid: new = json.load(fid)
+
+    key = lambda r: (r["rows"], r["cols"], r["stage"])
+    ref = {key(r): r["seconds"] for r in old["results"]}
+    print(f"old: {old['meta']['commit']}, new: {new['meta']['commit']}")
+    print(f"{'rows':>8} {'cols':>5} {'stage':>10} {'old':>10} {'new':>10} {'ratio':>7}")
+    for r in new["results"]:
+        t = ref.get(key(r))
+        if t is None or r["seconds"] is None: continue
+        print(f"{r['rows']:>8} {r['cols']:>5} {r['stage']:>10} "
+              f"{t:>10.4f} {r['seconds']:>10.4f} {r['seconds'] / t:>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Benchmark the radar pipeline")
+    parser.add_argument("--rows", type = int, nargs = "+", default = ROWS)
+    parser.add_argument("--cols", type = int, nargs = "+", default = COLS)
+    parser.add_argument("--repeat", type = int, default = 3)
+    parser.add_argument("--max-draw-cells", type = float, default = 1e6,
+                        help = "skip artists/draw/savefig if rows x cols exceeds this")
+    parser.add_argument("--quick", action = "store_true",
+                        help = "small grid (rows 10, 1000; cols 3, 12)")
+    parser.add_argument("--output", type = str, default = None,
+                        help = "JSON file to write the results to (default: stdout)")
+    parser.add_argument("--compare", type = str, nargs = 2, metavar = ("OLD", "NEW"),
+                        help = "compare two result files and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    if args.quick:
+        args.rows, args.cols = [10, 1000], [3, 12]
+
+    results = []
+    for nrow in args.rows:
+        for ncol in args.cols:
+            res = bench_one(nrow, ncol, repeat = args.repeat,
+                            max_draw_cells = args.max_draw_cells)
+            for stage, sec in res.items():
+                results.append(dict(rows = nrow, cols = ncol, stage = stage, seconds = sec))
+            print(f"rows = {nrow:>6}, cols = {ncol:>3}: " +
+                  ", ".join(f"{k} {v:.4f}" for k, v in res.items() if v is not None),
+                  file = sys.stderr)
+
+    out = json.dumps(dict(meta = metadata(), results = results), indent = 1)
+    if args.output is None:
+        print(out)
+    else:
+        with open(args.output, "w") as fid: fid.write(out)
+
+
+if __name__ == "__main__":
+    main()
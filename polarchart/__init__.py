@@ -1,4 +1,50 @@
 
+import sys as _sys
+from types import ModuleType as _ModuleType
 
-from .radar import radar
-from .get_demodata import get_demodata
+# Objects are imported lazily on first access (PEP 562) such that
+# 'import polarchart' does not import pandas, matplotlib, or colorspace.
+_lazy = {"radar":            ".radar",
+         "radar_array":      ".radar",
+         "radar_pages":      ".pages",
+         "export_pages":     ".pages",
+         "radar_summary":    ".summary",
+         "radar_thumbnails": ".thumbnail",
+         "radar_stream":     ".stream",
+         "export_stream":    ".stream",
+         "RenderStats":      ".stats",
+         "RadarHandle":      ".handle",
+         "RadarGeometry":    ".geometry",
+         "VirtualGrid":      ".virtual",
+         "TileRenderer":     ".tiles",
+         "AsyncRenderer":    ".aio",
+         "MemoryCache":      ".cache",
+         "DiskCache":        ".cache",
+         "radar_animation":  ".animate",
+         "get_demodata":     ".get_demodata"}
+
+__all__ = list(_lazy)
+
+
+def __getattr__(name):
+    if not name in _lazy:
+        raise AttributeError(f"module 'polarchart' has no attribute '{name}'")
+    from importlib import import_module
+    obj = getattr(import_module(_lazy[name], __name__), name)
+    globals()[name] = obj # Cached, __getattr__ is only called once
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyModule(_ModuleType):
+    """Importing a submodule (e.g., 'polarchart.radar') binds it as an
+    attribute of the package; prevents that submodules shadow the functions
+    of the same name ('radar', 'get_demodata')."""
+    def __setattr__(self, name, value):
+        if name in _lazy and isinstance(value, _ModuleType): return
+        super().__setattr__(name, value)
+
+_sys.modules[__name__].__class__ = _LazyModule
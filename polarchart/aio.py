@@ -0,0 +1,209 @@
+
+import asyncio
+
+
+class AsyncRenderer:
+    """Render Radar Charts from Asynchronous Code
+
+    Runs `radar()` on a thread or process pool such that the event loop
+    (e.g., of an asynchronous web service) is never blocked. The number
+    of concurrent renderings is limited by a semaphore; a slot is only
+    released when the rendering has actually finished (also if the caller
+    was cancelled or timed out) such that the CPU is never oversubscribed.
+    Requests exceeding `max_pending` waiting requests are rejected
+    immediately (backpressure) instead of piling up.
+
+    Args:
+        executor (str or concurrent.futures.Executor): "process" (default) or
+            "thread" to create a pool of worker processes or threads, or an
+            existing executor (not shut down by `close()`). Rendering holds
+            the GIL most of the time; threads therefore neither render in
+            parallel nor leave the event loop fully responsive, but avoid
+            pickling the data and allow arguments which cannot be pickled.
+        max_workers (None or int): Size of the pool (ignored if `executor`
+            is an existing executor). Defaults to the number of CPUs.
+        max_concurrent (None or int): Maximum number of concurrent
+            renderings, defaults to `max_workers`.
+        max_pending (None or int): Maximum number of requests waiting for
+            a slot. If `None` (default) the number is not limited.
+        timeout (None, float, or int): Default timeout in seconds (including
+            the time waiting for a slot), see `render()`.
+
+    Examples:
+
+        >>> import asyncio
+        >>> from polarchart import get_demodata, AsyncRenderer
+        >>>
+        >>> async def main():
+        >>>     gsa = get_demodata("gsa")
+        >>>     async with AsyncRenderer(max_pending = 100, timeout = 10) as renderer:
+        >>>         png = await renderer.render(gsa, output = "png")
+        >>>         svg = await renderer.render(gsa, output = "svg", circles = False)
+        >>>     return png, svg
+        >>>
+        >>> if __name__ == "__main__": # Required for worker processes
+        >>>     png, svg = asyncio.run(main())
+    """
+
+    def __init__(self, executor = "process", max_workers = None, max_concurrent = None,
+                 max_pending = None, timeout = None):
+        import os
+        from concurrent.futures import Executor
+
+        for name, x in [("max_workers", max_workers), ("max_concurrent", max_concurrent),
+                        ("max_pending", max_pending)]:
+            if not isinstance(x, (type(None), int)):
+                raise TypeError(f"argument '{name}' must be None or int")
+            if isinstance(x, int) and x < (0 if name == "max_pending" else 1):
+                raise ValueError(f"argument '{name}' (if set) must be a "
+                                 f"{'non-negative' if name == 'max_pending' else 'positive'} integer")
+        _check_timeout(timeout)
+
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self._own = not isinstance(executor, Executor)
+        if executor == "thread":
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(max_workers = max_workers,
+                                          thread_name_prefix = "polarchart")
+        elif executor == "process":
+            from concurrent.futures import ProcessPoolExecutor
+            from .pages import _init_export_worker
+            executor = ProcessPoolExecutor(max_workers = max_workers,
+                                           initializer = _init_export_worker)
+        elif self._own:
+            raise ValueError("argument 'executor' must be \"thread\", \"process\", "
+                             "or a concurrent.futures.Executor")
+
+        self.executor       = executor
+        self.max_concurrent = max_workers if max_concurrent is None else max_concurrent
+        self.max_pending    = max_pending
+        self.timeout        = timeout
+        self.active         = 0 # Renderings running (or submitted)
+        self.pending        = 0 # Requests waiting for a slot
+        self._semaphore     = None # Created on first use (bound to the event loop)
+
+    async def render(self, df, output = "png", timeout = None, **kwargs):
+        """Render Radar Charts
+
+        Args:
+            df (pandas.core.frame.DataFrame): The data, see `radar()`.
+            output (str): Format of the image, one of "png" (default),
+                "svg", or "pdf", see `radar()`.
+            timeout (None, float, or int): Timeout in seconds, including the
+                time waiting for a slot. Defaults to the timeout of the renderer.
+            **kwargs: Forwarded to `radar()`. With a process pool, the
+                "cache" argument must be a `DiskCache` (or `True`, a cache
+                per worker process).
+
+        Raises:
+            asyncio.QueueFull: If `max_pending` requests are already waiting.
+            TimeoutError: If the image is not ready within `timeout` seconds
+                (the built-in exception, on all Python versions).
+            asyncio.CancelledError: If the calling task is cancelled. Renderings
+                not yet started are withdrawn; running renderings complete
+                in the background (occupying their slot).
+
+        Returns:
+            bytes : The encoded image.
+        """
+        from functools import partial
+        from concurrent.futures import ProcessPoolExecutor
+        from .cache import MemoryCache
+
+        if not output in ["png", "svg", "pdf"]:
+            raise ValueError("argument 'output' must be \"png\", \"svg\", or \"pdf\"")
+        _check_timeout(timeout)
+        if self.executor is None:
+            raise RuntimeError("renderer has been closed")
+        if isinstance(kwargs.get("cache"), MemoryCache) and \
+           isinstance(self.executor, ProcessPoolExecutor):
+            raise ValueError("**kwarg 'cache' must be a DiskCache or True when using processes")
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(self._render(partial(_render, df, output, kwargs)), timeout)
+        except asyncio.TimeoutError as e:
+            # Python < 3.11: asyncio.TimeoutError is not the built-in TimeoutError
+            raise TimeoutError(f"rendering not finished within {timeout} seconds") from e
+
+    async def _render(self, fun):
+        """Acquire a slot, submit, and wait for the result"""
+        if self._semaphore.locked() and self.max_pending is not None and \
+           self.pending >= self.max_pending:
+            raise asyncio.QueueFull(f"too many pending renderings ({self.pending})")
+
+        self.pending += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.pending -= 1
+
+        # The slot is released once the rendering has finished (or has been
+        # withdrawn before it started), not when the caller stops waiting.
+        try:
+            future = self.executor.submit(fun)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        self.active += 1
+        loop = asyncio.get_running_loop()
+        future.add_done_callback(lambda f: _call_soon(loop, self._release))
+
+        # Shielded: cancelling the caller does not cancel the rendering
+        # (the result is consumed to avoid 'never retrieved' warnings).
+        result = asyncio.wrap_future(future)
+        result.add_done_callback(lambda f: f.cancelled() or f.exception())
+        try:
+            return await asyncio.shield(result)
+        except asyncio.CancelledError:
+            future.cancel() # Only succeeds if not yet started
+            raise
+
+    def _release(self):
+        self.active -= 1
+        self._semaphore.release()
+
+    def close(self, wait = True):
+        """Shut down the pool (if created by the renderer)
+
+        Args:
+            wait (bool): Wait for running renderings to finish.
+        """
+        if self.executor is not None and self._own:
+            self.executor.shutdown(wait = wait, cancel_futures = True)
+        self.executor = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        # Shutting down (waiting for the workers) without blocking the loop
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def __repr__(self):
+        return (f"AsyncRenderer({self.active} of {self.max_concurrent} active, "
+                f"{self.pending} pending)")
+
+
+def _check_timeout(timeout):
+    if not isinstance(timeout, (type(None), int, float)) or isinstance(timeout, bool):
+        raise TypeError("argument 'timeout' must be None, float, or int")
+    if timeout is not None and not timeout > 0:
+        raise ValueError("argument 'timeout' (if set) must be positive")
+
+
+def _call_soon(loop, fun):
+    """Schedule `fun` on the event loop (from a worker thread)"""
+    try:
+        loop.call_soon_threadsafe(fun)
+    except RuntimeError:
+        pass # Event loop closed
+
+
+def _render(df, output, kwargs):
+    """Render One Image (executed in the worker threads or processes)"""
+    from .radar import radar
+    return radar(df, output = output, **kwargs)
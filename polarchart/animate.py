@@ -0,0 +1,163 @@
+
+import numpy as np
+
+
+def radar_animation(data, time = None, labels = True, index = None, columns = None,
+                    ax = None, scale = True, interval = 200, blit = False, **kwargs):
+    """Animated Radar Charts
+
+    Animates how the radar charts change over time (one frame per time
+    step). The grid, circles, labels, and the legend are created once (see
+    `radar()`); for each frame only the vertices of the segments are
+    replaced (see `RadarHandle`). Based on `matplotlib.animation.FuncAnimation`,
+    wherefore the animation can be shown interactively or written to
+    file using the matplotlib writers (e.g., MP4 via 'ffmpeg', GIF via 'pillow').
+
+    Args:
+        data (numpy.ndarray, pandas.core.frame.DataFrame): Either a three-dimensional
+            numeric array of shape `(frames, n, k)` (`n` radar charts with `k`
+            segments each), or a DataFrame in long format with one row per
+            time step and radar chart; see arguments `time` and `labels`.
+        time (None, str, or list): If `data` is a DataFrame, the name of the
+            column containing the time (frames are sorted by time). For arrays,
+            `None` (default) or a list with one label per frame.
+            The label of the current frame is shown in the top right corner.
+        labels (str, or bool): If `data` is a DataFrame, the name of the
+            column identifying the radar charts (required). For arrays a bool,
+            see `radar()`.
+        index (None or list): Labels of the radar charts (arrays only),
+            see `radar_array()`.
+        columns (None or list): Names of the segments (arrays only),
+            see `radar_array()`.
+        ax (None or matplotlib.axes._axes.Axes): If `None` a standalone
+            `matplotlib.figure.Figure` is created (not registered with
+            `matplotlib.pyplot`; sufficient to write the animation to file).
+            Provide an axis (e.g., from `matplotlib.pyplot.subplots()`) to
+            show the animation interactively.
+        scale (bool): Should the data be scaled? If `True` (default) the
+            scaling is based on all frames such that the frames are comparable.
+        interval (int): Delay between frames in milliseconds.
+        blit (bool): Forwarded to `FuncAnimation`; if `True` only the segments
+            and circles are redrawn when shown interactively (the frame
+            labels are not updated in this case). Has no effect when saving.
+        **kwargs: Forwarded to `radar()` (e.g., "ncol", "circles", "color",
+            "legend_position", "title", "angle", "figsize", "ring_labels",
+            "fast_labels", "lod"). For large grids `ring_labels = "legend"` and
+            `fast_labels = True` are recommended.
+
+    Returns:
+        matplotlib.animation.FuncAnimation : The animation (a reference must
+        be kept as long as the animation is running).
+
+    Examples:
+
+        >>> import numpy as np
+        >>> from polarchart import radar_animation
+        >>> x = np.cumsum(np.random.normal(size = (100, 12, 6)), axis = 0)
+        >>> anim = radar_animation(x, time = [f"day {i + 1}" for i in range(100)],
+        >>>                        ring_labels = "legend")
+        >>> anim.save("radar.gif", writer = "pillow", fps = 10)
+    """
+
+    from pandas import DataFrame
+    from matplotlib import axes
+    from matplotlib.animation import FuncAnimation
+    from .radar import radar
+    from .utils import scale_df
+
+    # -----------------------------------------------------------------
+    # Sanity checks, remaining arguments are checked by radar()
+    # -----------------------------------------------------------------
+    if not isinstance(ax, (axes._axes.Axes, type(None))):
+        raise TypeError("argument 'ax' must be None or matplotlib.axes._axes.Axes")
+    if not isinstance(scale, bool):
+        raise TypeError("argument 'scale' must be boolean True (default) or False")
+    if not isinstance(interval, int):
+        raise TypeError("argument 'interval' must be int")
+    if not isinstance(blit, bool):
+        raise TypeError("argument 'blit' must be bool")
+    for k in ["handle", "output"]:
+        if k in kwargs:
+            raise ValueError(f"argument '{k}' not allowed in radar_animation()")
+
+    if isinstance(data, DataFrame):
+        if index is not None or columns is not None:
+            raise ValueError("arguments 'index' and 'columns' are only used if 'data' is an array")
+        frames, time, index, columns = _long_to_frames(data, time, labels)
+        labels = True
+    else:
+        frames = np.asarray(data, dtype = float)
+        if not frames.ndim == 3:
+            raise ValueError("argument 'data' must be three-dimensional (frames, n, k)")
+        if not isinstance(time, (type(None), list)):
+            raise TypeError("argument 'time' must be None or list if 'data' is an array")
+        if time is not None and not len(time) == frames.shape[0]:
+            raise ValueError("length of 'time' does not match the number of frames")
+        if not isinstance(labels, bool):
+            raise TypeError("argument 'labels' must be bool if 'data' is an array")
+    if frames.shape[0] == 0 or frames.shape[1] == 0:
+        raise ValueError("argument 'data' contains no frames or no radar charts")
+
+    # Scaling all frames at once (as one data set)
+    nframes, n, k = frames.shape
+    if scale:
+        frames = scale_df(frames.reshape(-1, k)).reshape(nframes, n, k)
+        xmax   = 1
+    else:
+        xmax   = float(np.nanmax(frames))
+    xmax = kwargs.pop("xmax", xmax)
+
+    if ax is None:
+        from matplotlib.figure import Figure
+        ax = Figure(figsize = kwargs.pop("figsize", (6, 6))).subplots()
+
+    # Drawing the first frame, keeping the handle to swap the values
+    handle = radar(DataFrame(frames[0], index = index, columns = columns, copy = False),
+                   labels = labels, ax = ax, scale = False, xmax = xmax,
+                   handle = True, **kwargs)
+    label = None if time is None else ax.set_title(str(time[0]), loc = "right", fontsize = 8)
+
+    def draw_frame(i):
+        handle.set_values(frames[i])
+        if label is None:
+            return [handle.collection] + handle.overlay
+        label.set_text(str(time[i]))
+        return [handle.collection] + handle.overlay + [label]
+
+    return FuncAnimation(ax.figure, draw_frame, frames = nframes,
+                         interval = interval, blit = blit,
+                         cache_frame_data = False)
+
+
+def _long_to_frames(df, time, labels):
+    """Long Format to Frames
+
+    Converts a DataFrame in long format (one row per time step and radar
+    chart) into a three-dimensional array of shape `(frames, n, k)`.
+    Combinations of time and radar chart not present in `df` are missing.
+
+    Returns:
+        list : Returns a list of length four with the array, the (sorted)
+        times, the labels of the radar charts, and the names of the segments.
+    """
+    from pandas import MultiIndex, unique
+    from pandas.api.types import is_numeric_dtype
+
+    if not isinstance(time, str) or not time in df.columns:
+        raise ValueError("argument 'time' must be the name of the time column if 'data' is a DataFrame")
+    if not isinstance(labels, str) or not labels in df.columns:
+        raise ValueError("argument 'labels' must be the name of the column identifying "
+                         "the radar charts if 'data' is a DataFrame")
+
+    columns = [c for c in df.columns if not c in [time, labels] and is_numeric_dtype(df[c])]
+    if len(columns) == 0:
+        raise ValueError("no numeric columns found in 'data'")
+
+    x = df.set_index([time, labels])[columns]
+    if x.index.duplicated().any():
+        raise ValueError("combinations of 'time' and 'labels' must be unique")
+
+    times = np.sort(unique(df[time]))
+    ids   = unique(df[labels])
+    x     = x.reindex(MultiIndex.from_product([times, ids])).to_numpy(dtype = float)
+    return x.reshape(len(times), len(ids), len(columns)), list(times), list(ids), columns
@@ -0,0 +1,280 @@
+
+import os
+import threading
+
+
+def hash_data(df, *args):
+    """Content Hash
+
+    Hashes the values, the index, and the column names of a DataFrame
+    (or the bytes of a numpy array) together with additional arguments
+    (e.g., the style). The additional arguments are hashed via their `repr()`.
+
+    Args:
+        df (pandas.core.frame.DataFrame or numpy.ndarray): The data.
+        *args: Additional objects to be included.
+
+    Returns:
+        str : Hexadecimal SHA-1 hash.
+    """
+    import hashlib
+    import numpy as np
+    from pandas import DataFrame
+    from pandas.util import hash_pandas_object
+
+    h = hashlib.sha1()
+    if isinstance(df, DataFrame):
+        # One 64 bit hash per row (values and index), plus columns and dtypes
+        h.update(hash_pandas_object(df, index = True).to_numpy().tobytes())
+        h.update(repr(list(df.columns)).encode())
+        h.update(repr(list(df.dtypes.astype(str))).encode())
+    else:
+        x = np.ascontiguousarray(df)
+        h.update(repr((x.shape, x.dtype.str)).encode())
+        h.update(x.tobytes())
+    for a in args:
+        h.update(repr(a).encode())
+    return h.hexdigest()
+
+
+def render_key(df, *args):
+    """Cache Key of a Rendering
+
+    Returns:
+        str : Key of the form '<data hash>_<arguments hash>' such that all
+        entries of one data set can be invalidated at once (see
+        `MemoryCache.invalidate_data()`). The arguments hash includes the
+        matplotlib version and settings (`rcParams`).
+    """
+    import hashlib
+    import matplotlib
+    # Without 'backend', resolving the backend may import pyplot
+    rc   = [(k, matplotlib.rcParams[k]) for k in sorted(matplotlib.rcParams) if not k == "backend"]
+    args = (matplotlib.__version__, rc) + args
+    return hash_data(df) + "_" + hashlib.sha1(repr(args).encode()).hexdigest()
+
+
+class MemoryCache:
+    """Size-Bounded LRU Cache in Memory
+
+    Stores bytes (e.g., rendered images, see the "cache" argument of
+    `radar()`). If the total size exceeds `max_bytes` the least recently
+    used entries are removed. Thread-safe.
+
+    Args:
+        max_bytes (int): Maximum total size of all entries, defaults to 64 MiB.
+
+    Examples:
+
+        >>> from polarchart import get_demodata, radar, MemoryCache
+        >>> cache = MemoryCache()
+        >>> gsa   = get_demodata("gsa")
+        >>> png   = radar(gsa, output = "png", cache = cache) # Rendered
+        >>> png   = radar(gsa, output = "png", cache = cache) # From cache
+        >>> cache.invalidate_data(gsa)
+    """
+
+    def __init__(self, max_bytes = 64 * 2**20):
+        from collections import OrderedDict
+        if not isinstance(max_bytes, int) or max_bytes <= 0:
+            raise ValueError("argument 'max_bytes' must be a positive integer")
+        self.max_bytes = max_bytes
+        self.hits      = 0
+        self.misses    = 0
+        self._data     = OrderedDict()
+        self._size     = 0
+        self._lock     = threading.Lock()
+
+    def get(self, key):
+        """Cached bytes for `key` or `None` (marks the entry as recently used)"""
+        with self._lock:
+            res = self._data.get(key)
+            if res is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+            return res
+
+    def put(self, key, value):
+        """Store bytes `value` for `key`; evicts old entries if needed"""
+        if not isinstance(value, bytes):
+            raise TypeError("argument 'value' must be bytes")
+        if len(value) > self.max_bytes: return # Too large to be cached
+        with self._lock:
+            old = self._data.pop(key, None)
+            self._size += len(value) - (0 if old is None else len(old))
+            self._data[key] = value
+            while self._size > self.max_bytes:
+                self._size -= len(self._data.popitem(last = False)[1])
+
+    def invalidate(self, key):
+        """Remove the entry for `key` (if any)"""
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None: self._size -= len(old)
+
+    def invalidate_data(self, df):
+        """Remove all entries rendered from the data set `df`"""
+        prefix = hash_data(df) + "_"
+        with self._lock:
+            keys = [k for k in self._data if k.startswith(prefix)]
+        for k in keys: self.invalidate(k)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return (f"MemoryCache({len(self._data)} entries, {self._size / 2**20:.1f} of "
+                f"{self.max_bytes / 2**20:.1f}MiB, {self.hits} hits, {self.misses} misses)")
+
+
+_default_cache = None
+
+def default_cache():
+    """Shared `MemoryCache` used by `radar(..., cache = True)`"""
+    global _default_cache
+    if _default_cache is None: _default_cache = MemoryCache()
+    return _default_cache
+
+
+class DiskCache:
+    """Size-Bounded LRU Cache on Disk
+
+    Stores bytes (e.g., rendered images) as one file per key in
+    `path`. If the total size exceeds `max_bytes` the least recently used
+    entries (access time tracked via the modification time of the
+    files) are removed. Files are written atomically such that several
+    processes can share one cache directory.
+
+    Args:
+        path (str): Cache directory, created if it does not exist.
+        max_bytes (int): Maximum total size of all entries, defaults to 256 MiB.
+        suffix (str): File name suffix of the entries.
+
+    Examples:
+
+        >>> from polarchart.cache import DiskCache
+        >>> cache = DiskCache("tiles", max_bytes = 2**20)
+        >>> cache.put("abc", b"...")
+        >>> cache.get("abc")
+    """
+
+    def __init__(self, path, max_bytes = 256 * 2**20, suffix = ".png"):
+        if not isinstance(path, str):
+            raise TypeError("argument 'path' must be str")
+        if not isinstance(max_bytes, int) or max_bytes <= 0:
+            raise ValueError("argument 'max_bytes' must be a positive integer")
+        if not isinstance(suffix, str):
+            raise TypeError("argument 'suffix' must be str")
+
+        os.makedirs(path, exist_ok = True)
+        self.path      = path
+        self.max_bytes = max_bytes
+        self.suffix    = suffix
+        self._lock     = threading.Lock()
+        self._size     = sum(size for _, size, _ in self._entries())
+
+    def _file(self, key):
+        return os.path.join(self.path, key + self.suffix)
+
+    def get(self, key):
+        """Cached bytes for `key` or `None` (marks the entry as recently used)"""
+        file = self._file(key)
+        try:
+            with open(file, "rb") as fid: res = fid.read()
+            os.utime(file)
+        except FileNotFoundError:
+            return None
+        return res
+
+    def put(self, key, value):
+        """Store bytes `value` for `key`; evicts old entries if needed"""
+        if not isinstance(value, bytes):
+            raise TypeError("argument 'value' must be bytes")
+        import tempfile
+        # Unique temporary file per writer (threads and processes)
+        fd, tmp = tempfile.mkstemp(dir = self.path, suffix = ".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fid: fid.write(value)
+            file = self._file(key)
+            with self._lock:
+                try:
+                    old = os.path.getsize(file)
+                except FileNotFoundError:
+                    old = 0
+                os.replace(tmp, file)
+                self._size += len(value) - old
+                evict = self._size > self.max_bytes
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+        if evict: self._evict()
+
+    def invalidate(self, key):
+        """Remove the entry for `key` (if any)"""
+        with self._lock:
+            try:
+                size = os.path.getsize(self._file(key))
+                os.remove(self._file(key))
+                self._size -= size
+            except FileNotFoundError:
+                pass
+
+    def invalidate_data(self, df):
+        """Remove all entries rendered from the data set `df` (see `render_key()`)"""
+        prefix = hash_data(df) + "_"
+        for e in os.scandir(self.path):
+            if e.name.startswith(prefix) and e.name.endswith(self.suffix):
+                self.invalidate(e.name[:-len(self.suffix)])
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            for _, _, file in self._entries():
+                try:
+                    os.remove(file)
+                except FileNotFoundError:
+                    pass
+            self._size = 0
+
+    def _entries(self):
+        """List of (mtime, size, path) of all entries; entries removed
+        meanwhile (e.g., by another process) are skipped"""
+        res = []
+        for e in os.scandir(self.path):
+            if not e.name.endswith(self.suffix): continue
+            try:
+                st = e.stat()
+            except FileNotFoundError:
+                continue
+            res.append((st.st_mtime, st.st_size, e.path))
+        return res
+
+    def _evict(self):
+        """Remove least recently used entries until the size limit is met"""
+        with self._lock:
+            entries = sorted(self._entries())
+            self._size = sum(e[1] for e in entries)
+            for _, size, file in entries:
+                if self._size <= self.max_bytes: break
+                try:
+                    os.remove(file)
+                except FileNotFoundError:
+                    pass
+                self._size -= size
+
+    def __len__(self):
+        return sum(1 for e in os.scandir(self.path) if e.name.endswith(self.suffix))
+
+    def __repr__(self):
+        return f"DiskCache('{self.path}', {self._size / 2**20:.1f} of {self.max_bytes / 2**20:.1f}MiB)"
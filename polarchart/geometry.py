@@ -0,0 +1,419 @@
+
+import numpy as np
+
+
+def calc_radar_verts(values, centers, radius, xmax, angle = 0,
+                     step = 2 * np.pi / 180):
+    """calc_radar_verts(values, centers, radius, xmax, angle = 0, step = 2 * np.pi / 180)
+
+    Vectorized version of `calc_radar_coords()`; calculates the vertices
+    of all segments of all radar charts at once.
+
+    Args:
+        values : numpy.ndarray
+            Two-dimensional numeric array of shape `(n, k)`; one row per
+            radar chart, one column per segment.
+        centers : numpy.ndarray
+            Array of shape `(n, 2)` with the `(x, y)` coordinates of the
+            center of each of the `n` radar charts.
+        radius : float
+            Radius of the segments, see `calc_radar_coords()`.
+        xmax : num
+            Additional scaling factor, see `calc_radar_coords()`.
+        angle : float or int
+            Rotation angle (in degrees), defaults to '0'.
+        step : float
+            Maximum angular distance (radiant) between two neighboring
+            vertices along the arc; defaults to 2 degrees.
+
+    Returns:
+        list : Returns a list of length two. The first element is a
+        contiguous `numpy.ndarray` of shape `(m, 2)` containing the vertices
+        of all `n * k` segments (row by row, segment by segment), the second
+        one an integer array of length `n * k + 1` with the offsets, i.e.,
+        the vertices of segment `i` are `vertices[offsets[i]:offsets[i + 1]]`.
+        All segments consist of the same number of vertices (the center
+        followed by the arc) wherefore `vertices` can also be reshaped to
+        `(n * k, -1, 2)`.
+    """
+    values  = np.asarray(values, dtype = float)
+    centers = np.asarray(centers, dtype = float)
+    if values.ndim != 2:
+        raise ValueError("argument 'values' must be two-dimensional")
+    if centers.shape != (values.shape[0], 2):
+        raise ValueError("argument 'centers' must be of shape (n, 2)")
+
+    n, k = values.shape
+
+    ## Angles of the segment borders (radiant), the number of points
+    ## along the arc is the same for all segments as all have the same width.
+    ## The distance between two neighboring points does not exceed 'step'.
+    theta = np.linspace(0, -2 * np.pi, k + 1) + angle / 180 * np.pi
+    npts  = int(np.ceil(2 * np.pi / k / step - 1e-6)) + 1
+    arc   = theta[:-1, None] + np.diff(theta)[:, None] * np.linspace(0, 1, npts)
+    unit  = np.stack([np.cos(arc), np.sin(arc)], axis = -1) # (k, npts, 2)
+
+    ## First vertex of each segment is the center, followed by the arc
+    verts = np.empty((n, k, npts + 1, 2))
+    verts[:, :, 0, :]  = centers[:, None, :]
+    verts[:, :, 1:, :] = unit[None, :, :, :] * (values * (radius / xmax))[:, :, None, None]
+    verts[:, :, 1:, :] += centers[:, None, None, :]
+
+    offsets = np.arange(n * k + 1) * (npts + 1)
+    return verts.reshape(-1, 2), offsets
+
+
+def calc_label_coords(k, center, radius, angle = 0):
+    """calc_label_coords(k, center, radius, angle = 0)
+
+    Args:
+        k : int
+            Number of segments.
+        center : tuple
+            Tuple with two numeric values defining the center.
+        radius : float
+            Radius of the segments, see `calc_radar_coords()`.
+        angle : float or int
+            Rotation angle (in degrees), defaults to '0'.
+
+    Returns:
+        numpy.ndarray : Array of shape `(k, 2)` with the `(x, y)` coordinates
+        to position the segment labels (middle of each segment).
+    """
+    theta      = np.linspace(0, -2 * np.pi, k + 1) + angle / 180 * np.pi
+    theta_mids = (theta[:-1] + theta[1:]) / 2.0
+    return np.column_stack([center[0] + 1.4 * radius * np.cos(theta_mids),
+                            center[1] + 1.4 * radius * np.sin(theta_mids)])
+
+
+def calc_circle_verts(radius, at, xmax, n = 180):
+    """calc_circle_verts(radius, at, xmax, n = 180)
+
+    Calculates the reference circles once, centered at `(0, 0)`. The
+    result serves as a template which is shifted to the center of each
+    radar chart (see `get_circle_coords()`).
+
+    Args:
+        radius : num
+            Positive numeric, maximum radius, see `get_circle_coords()`.
+        at : list
+            List of numeric values for which a circle should be
+            drawn (calculated).
+        xmax : num
+            Additional scaling factor, see `get_circle_coords()`.
+        n : int
+            Number of points along each circle, defaults to '180'.
+
+    Returns:
+        list : Returns a list of length two. The first element is
+        a `numpy.ndarray` of shape `(len(at), n, 2)` containing the vertices
+        of the circles, the second one a dictionary with the `(x, y)`
+        coordinates (relative to the center) of the labels. The dict keys
+        are the formatted values of `at`.
+    """
+    theta    = np.linspace(0, -2 * np.pi, n) # Calculating angles
+    anglerad = -45 / 180 * np.pi
+    at       = np.asarray(at, dtype = float)
+
+    # Number of significant digits needed
+    digits = max(0, int((-np.floor(np.log10(at))).max()))
+
+    # Multiply by radius for proper scaling
+    unit  = np.column_stack([np.cos(theta), np.sin(theta)])
+    verts = (at * radius / xmax)[:, None, None] * unit[None, :, :]
+
+    labels = dict()
+    for a in at:
+        labels[f"{a:.{digits}f}"] = (a * radius * np.cos(anglerad) / xmax,
+                                     a * radius * np.sin(anglerad) / xmax)
+
+    return verts, labels
+
+
+def calc_arc_step(radius, tolerance, min_step = 2 * np.pi / 720,
+                  max_step = np.pi / 4):
+    """calc_arc_step(radius, tolerance, min_step = 2 * np.pi / 720, max_step = np.pi / 4)
+
+    Level of detail; calculates the largest angular step between two
+    neighboring vertices along an arc such that the maximum distance
+    between the polygon and the true arc (sagitta) does not exceed
+    `tolerance`.
+
+    Args:
+        radius : float
+            Radius of the arc, e.g., in pixels of the rendered figure.
+        tolerance : float
+            Maximum allowed deviation, same unit as `radius`.
+        min_step : float
+            Smallest step (radiant) returned, defaults to half a degree.
+        max_step : float
+            Largest step (radiant) returned, defaults to 45 degrees.
+
+    Returns:
+        float : Angular step in radiant.
+    """
+    if not radius > tolerance:
+        return float(max_step)
+    step = 2 * np.arccos(1 - tolerance / radius)
+    return float(np.clip(step, min_step, max_step))
+
+
+class RadarGeometry:
+    """RadarGeometry(centers, vertices, offsets, color_index)
+
+    Compact container for the segments of a set of radar charts, e.g., to
+    calculate the geometry once and draw it many times (different colors,
+    several axes, or processes). All vertices are stored in one contiguous
+    array (`float32` by default), the segments are defined by offsets
+    (see `calc_radar_verts()`) and each segment has the index of its
+    color (column of the data). Can be stored as `.npz` (`save()`,
+    `load()`) or serialized into one contiguous buffer (`tobytes()`,
+    `frombuffer()`; without copying the arrays, e.g., via shared memory).
+
+    Args:
+        centers : numpy.ndarray
+            Array of shape `(n, 2)` with the centers of the `n` radar charts.
+        vertices : numpy.ndarray
+            Array of shape `(m, 2)` with the vertices of all segments,
+            `float32` or `float64`.
+        offsets : numpy.ndarray
+            Integer array of length `n * k + 1`; the vertices of segment `i`
+            are `vertices[offsets[i]:offsets[i + 1]]`.
+        color_index : numpy.ndarray
+            Integer array of length `n * k` with the color index of each segment.
+
+    Examples:
+
+        >>> from polarchart import get_demodata, RadarGeometry
+        >>> from matplotlib.figure import Figure
+        >>> geom = RadarGeometry.from_df(get_demodata("gsa"))
+        >>> geom.save("gsa_geometry.npz")
+        >>> geom = RadarGeometry.load("gsa_geometry.npz")
+        >>> fig  = Figure()
+        >>> ax1, ax2 = fig.subplots(1, 2)
+        >>> geom.draw(ax1)
+        >>> geom.draw(ax2, color = ["#e41a1c", "#377eb8", "#4daf4a", "#984ea3",
+        >>>                         "#ff7f00", "#ffff33", "#a65628", "#f781bf"])
+        >>> fig.savefig("gsa_geometry.png")
+    """
+
+    __slots__ = ("centers", "vertices", "offsets", "color_index")
+
+    # Header of the serialized buffer: magic, float type, n, k, m (number
+    # of vertices); followed by centers, vertices, offsets (int64), and
+    # color index (int32).
+    _header = "<4s4sqqq"
+
+    def __init__(self, centers, vertices, offsets, color_index):
+        vertices = np.asarray(vertices)
+        if not vertices.dtype in (np.float32, np.float64):
+            raise TypeError("argument 'vertices' must be of type float32 or float64")
+        if vertices.ndim != 2 or vertices.shape[1] != 2:
+            raise ValueError("argument 'vertices' must be of shape (m, 2)")
+        self.centers     = np.asarray(centers, dtype = vertices.dtype)
+        self.vertices    = vertices
+        self.offsets     = np.asarray(offsets, dtype = np.int64)
+        self.color_index = np.asarray(color_index, dtype = np.int32)
+        if self.centers.ndim != 2 or self.centers.shape[1] != 2:
+            raise ValueError("argument 'centers' must be of shape (n, 2)")
+        if self.offsets.size != self.color_index.size + 1 or \
+           self.offsets[-1] != vertices.shape[0]:
+            raise ValueError("arguments 'offsets' and 'color_index' do not match the vertices")
+
+    @classmethod
+    def from_values(cls, values, centers, radius = 0.4, xmax = 1, angle = 0,
+                    step = 2 * np.pi / 180, dtype = np.float32):
+        """from_values(values, centers, radius = 0.4, xmax = 1, angle = 0, step = 2 * np.pi / 180, dtype = np.float32)
+
+        Args:
+            values : numpy.ndarray
+                Array of shape `(n, k)`, see `calc_radar_verts()`.
+            centers : numpy.ndarray
+                Array of shape `(n, 2)`, see `calc_radar_verts()`.
+            radius, xmax, angle, step :
+                See `calc_radar_verts()`.
+            dtype : numpy.dtype
+                Type of the vertices, `numpy.float32` (default) or `numpy.float64`.
+
+        Returns:
+            RadarGeometry : Geometry of `n` radar charts with `k` segments each.
+        """
+        if not np.dtype(dtype) in (np.float32, np.float64):
+            raise TypeError("argument 'dtype' must be numpy.float32 or numpy.float64")
+        verts, offsets = calc_radar_verts(values, centers, radius = radius, xmax = xmax,
+                                          angle = angle, step = step)
+        n, k = np.shape(values)
+        return cls(centers, verts.astype(dtype), offsets, np.tile(np.arange(k), n))
+
+    @classmethod
+    def from_df(cls, df, ncol = None, legend = True, scale = True, numeric_only = False,
+                angle = 0, step = 2 * np.pi / 180, dtype = np.float32):
+        """from_df(df, ncol = None, legend = True, scale = True, numeric_only = False, angle = 0, step = 2 * np.pi / 180, dtype = np.float32)
+
+        Geometry of the radar charts in the same grid layout (row by row)
+        and scaling as drawn by `radar()` on a square axis.
+
+        Args:
+            df : pandas.DataFrame
+                Data, see `radar()`.
+            ncol : None or int
+                Number of columns of the grid; if `None` a (near) square grid
+                is used (see `utils.get_gridsize()`).
+            legend : bool
+                Should one grid cell be reserved for the legend (as
+                `radar()` does if the legend is positioned automatically)?
+            scale : bool
+                Should the data be scaled? See `radar()`.
+            numeric_only : bool
+                See `radar()`.
+            angle, step, dtype :
+                See `from_values()`.
+
+        Returns:
+            RadarGeometry : Geometry of the radar charts.
+        """
+        from .utils import prepare_num_df, scale_df, get_gridsize
+
+        if not isinstance(ncol, (type(None), int)):
+            raise TypeError("argument 'ncol' must be None or int")
+        if not isinstance(legend, bool):
+            raise TypeError("argument 'legend' must be boolean True (default) or False")
+        if not isinstance(scale, bool):
+            raise TypeError("argument 'scale' must be boolean True (default) or False")
+
+        _, df  = prepare_num_df(df, False, numeric_only)
+        values = np.array(df, dtype = float) # Copy, scaled in-place below
+        if scale:
+            values = scale_df(values, copy = False)
+            xmax   = 1
+        else:
+            xmax   = float(np.nanmax(values))
+        _, ncol = get_gridsize((1., 1.), ncol = ncol, n = values.shape[0] + int(legend))
+        idx = np.arange(values.shape[0])
+        return cls.from_values(values, np.column_stack([idx % ncol, idx // ncol]),
+                               radius = 0.4, xmax = xmax, angle = angle,
+                               step = step, dtype = dtype)
+
+    @property
+    def nbytes(self):
+        """Total size of all arrays in bytes"""
+        return sum(getattr(self, x).nbytes for x in self.__slots__)
+
+    def polygons(self):
+        """List of the vertices (`numpy.ndarray`) of each segment (views)"""
+        return np.split(self.vertices, self.offsets[1:-1])
+
+    def collection(self, color = None, **kwargs):
+        """collection(color = None, **kwargs)
+
+        Args:
+            color : None or list
+                Colors of the segments (one per color index); if `None`
+                `colorspace.qualitative_hcl("Dynamic")` is used as in `radar()`.
+            **kwargs :
+                Forwarded to `matplotlib.collections.PolyCollection`,
+                defaults to gray edges of width 0.5 as in `radar()`.
+
+        Returns:
+            matplotlib.collections.PolyCollection : The segments.
+        """
+        from matplotlib.collections import PolyCollection
+
+        k = int(self.color_index.max()) + 1 if self.color_index.size > 0 else 0
+        if color is None:
+            from colorspace import qualitative_hcl
+            color = qualitative_hcl("Dynamic")(k)
+        if not isinstance(color, list) or len(color) < k:
+            raise ValueError("argument 'color' must be a list with (at least) one color per color index")
+        kwargs = {"edgecolors": "gray", "linewidths": 0.5, **kwargs}
+
+        # Regular geometry (all segments of the same length) as a 3d array
+        n = np.diff(self.offsets)
+        verts = self.vertices.reshape(n.size, n[0], 2) if n.size > 0 and (n == n[0]).all() \
+                else self.polygons()
+        return PolyCollection(verts, closed = True,
+                              facecolors = [color[i] for i in self.color_index], **kwargs)
+
+    def draw(self, ax, color = None, **kwargs):
+        """draw(ax, color = None, **kwargs)
+
+        Adds the segments to an axis and sets the limits, the aspect
+        ratio, and the (inverted) y-axis as in `radar()`.
+
+        Args:
+            ax : matplotlib.axes.Axes
+                The axis to draw into.
+            color, **kwargs :
+                See `collection()`.
+
+        Returns:
+            matplotlib.collections.PolyCollection : The segments added to `ax`.
+        """
+        coll = ax.add_collection(self.collection(color, **kwargs), autolim = False)
+        if self.centers.shape[0] > 0:
+            (x0, y0), (x1, y1) = self.centers.min(axis = 0), self.centers.max(axis = 0)
+            ax.set_xlim(x0 - 0.5, x1 + 0.5)
+            ax.set_ylim(y1 + 0.5, y0 - 0.5)
+        ax.set_aspect("equal")
+        return coll
+
+    def save(self, file):
+        """Store the geometry as `.npz` (uncompressed; see `load()`)"""
+        np.savez(file, **{x: getattr(self, x) for x in self.__slots__})
+
+    @classmethod
+    def load(cls, file):
+        """Load a geometry stored by `save()`"""
+        with np.load(file, allow_pickle = False) as data:
+            return cls(*[data[x] for x in cls.__slots__])
+
+    def tobytes(self):
+        """Serialize into one contiguous buffer (bytes, see `frombuffer()`)"""
+        import struct
+        n, m = self.centers.shape[0], self.vertices.shape[0]
+        k    = self.color_index.size // n if n > 0 else 0
+        head = struct.pack(self._header, b"RGEO", self.vertices.dtype.str[1:].encode().ljust(4),
+                           n, k, m)
+        # Little-endian, see frombuffer()
+        return b"".join([head] + [np.ascontiguousarray(x, dtype = x.dtype.newbyteorder("<")).tobytes()
+                                  for x in [getattr(self, x) for x in self.__slots__]])
+
+    def __buffer__(self, flags):
+        # Python >= 3.12 (PEP 688), e.g., memoryview(geometry)
+        return memoryview(self.tobytes())
+
+    @classmethod
+    def frombuffer(cls, buffer):
+        """frombuffer(buffer)
+
+        Args:
+            buffer :
+                Any object supporting the buffer protocol (e.g., `bytes`,
+                `memoryview`, `mmap.mmap`, or the buffer of a
+                `multiprocessing.shared_memory.SharedMemory`) holding a
+                geometry serialized by `tobytes()`.
+
+        Returns:
+            RadarGeometry : The arrays are views into `buffer` (no copy;
+            read-only if `buffer` is read-only).
+        """
+        import struct
+        size = struct.calcsize(cls._header)
+        magic, dtype, n, k, m = struct.unpack_from(cls._header, buffer)
+        if magic != b"RGEO":
+            raise ValueError("argument 'buffer' does not contain a RadarGeometry")
+        dtype = np.dtype("<" + dtype.decode().strip())
+
+        args, pos = [], size
+        for dt, count in [(dtype, 2 * n), (dtype, 2 * m), ("<i8", n * k + 1), ("<i4", n * k)]:
+            args.append(np.frombuffer(buffer, dtype = dt, count = count, offset = pos))
+            pos += args[-1].nbytes
+        args[0], args[1] = args[0].reshape(n, 2), args[1].reshape(m, 2)
+        return cls(*args)
+
+    def __len__(self):
+        return self.centers.shape[0]
+
+    def __repr__(self):
+        return (f"RadarGeometry({len(self)} charts, {self.color_index.size} segments, "
+                f"{self.vertices.shape[0]} vertices ({self.vertices.dtype}), {self.nbytes / 2**20:.1f}MiB)")
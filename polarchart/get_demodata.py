@@ -1,5 +1,8 @@
 
 
+from functools import lru_cache
+
+
 def get_demodata(name):
     """Return Demo Data
 
@@ -29,30 +32,59 @@ def get_demodata(name):
     >>> gsa = get_demodata("gsa")
     >>> print(gsa)
     """
-    from importlib.resources import files
-    from pandas import read_csv, DataFrame
-    from pandas.api.types import is_numeric_dtype
-    from numpy import isnan, equal
-
     # Staying sane
     if not isinstance(name, (type(None), str)):
         raise TypeError("argument 'name' must be str or None")
 
-    # Loading available data sets
-    csv = files("polarchart.data").joinpath("available_demodata.csv")
-    datasets = read_csv(csv, index_col = 0,
-                        na_values = "None",  skipinitialspace = True)
-    datasets = datasets.rename_axis(None, axis = 0)
+    # Loading available data sets (cached)
+    datasets = _load_registry()
 
     # Return list of all available data sets
     if name is None:
-        return datasets[["description"]]
+        return datasets[["description"]].copy()
 
     # Else trying to find the corresponding data set
     if not name in datasets.index:
         tmp = ", ".join([f"\"{x}\"" for x in datasets.index])
         raise ValueError(f"dataset 'name' must be one of {tmp} (see 'get_demodata(None)')")
 
+    # The cached object is never handed out; the (small) copy ensures
+    # that the cache can not be modified by the user.
+    return _load_dataset(name).copy()
+
+
+@lru_cache(maxsize = 1)
+def _load_registry():
+    """Load (and cache) the list of available demo data sets
+
+    Returns:
+        pandas.DataFrame : Content of 'available_demodata.csv'.
+    """
+    from importlib.resources import files
+    from pandas import read_csv
+
+    csv = files("polarchart.data").joinpath("available_demodata.csv")
+    datasets = read_csv(csv, index_col = 0,
+                        na_values = "None",  skipinitialspace = True)
+    return datasets.rename_axis(None, axis = 0)
+
+
+@lru_cache(maxsize = 16)
+def _load_dataset(name):
+    """Load (and cache) one demo data set
+
+    Args:
+        name : str
+            Name of the data set, must be in the registry (see `_load_registry()`).
+
+    Returns:
+        pandas.DataFrame : The data set; must not be modified (cached).
+    """
+    from importlib.resources import files
+    from pandas import read_csv
+    from numpy import isnan, equal
+
+    datasets  = _load_registry()
     index_col = datasets.index_col[name]
     index_col = None if bool(isnan(index_col)) else int(index_col)
 
@@ -61,16 +93,12 @@ def get_demodata(name):
     try:
         res = read_csv(csv, index_col = index_col)
     except Exception as e:
-        raise Exception("problems loading data set (\"{csv}\"): {e}")
+        raise Exception(f"problems loading data set (\"{csv}\"): {e}")
 
-    # Do we have to scale the numeric columns?
+    # Do we have to scale the numeric columns? All at once.
     scale = datasets.scale[name]
     if not equal(scale, 1):
-        isnum = res.apply(is_numeric_dtype).values
-        # If not numeric: ignore, else scale
-        for i in range(len(isnum)):
-            if not isnum[i]: continue
-            res.iloc[:, i] = res.iloc[:, i] * scale
+        num = res.select_dtypes("number").columns
+        res[num] = res[num] * scale
 
     return res
-
@@ -0,0 +1,183 @@
+
+import numpy as np
+
+
+class RadarHandle:
+    """Handle to Update Radar Charts In-Place
+
+    Returned by `radar(..., handle = True)`. Keeps a reference to the
+    collection of all segments (the data layer) and the settings needed
+    to recalculate the vertices. `update()` replaces the vertices of the
+    existing collection in-place and redraws the data layer only by
+    blitting it onto a cached background (containing the static labels,
+    circles, and the legend). Intended for dashboards which refresh the
+    same grid of radar charts periodically.
+
+    The background is cached on the first update and invalidated whenever
+    the figure is redrawn entirely (e.g., when resizing the window).
+    If the canvas does not support blitting a regular (idle) redraw is
+    requested instead. The circles and their labels overlap with the
+    segments and are redrawn on every update; for large grids
+    `ring_labels = "legend"` (and `fast_labels = True`) is recommended.
+
+    Args:
+        ax (matplotlib.axes._axes.Axes): The axis holding the radar charts.
+        collection (matplotlib.collections.PolyCollection): The data layer.
+        overlay (list): Artists drawn on top of the data layer (circles,
+            circle labels), not part of the cached background but redrawn
+            after the data layer when blitting.
+        centers (numpy.ndarray): Array of shape `(n, 2)` with the
+            centers of the radar charts.
+        radius (float): Radius of the segments.
+        xmax (float): Value corresponding to the maximum radius.
+        angle (float): Rotation angle in degrees.
+        step (float): Angular resolution of the arcs (radiant).
+        columns (pandas.Index): Names of the segments.
+        limits (None or list): Minimum and range per column used to scale
+            the data (see `utils.scale_limits()`) or `None` if the data
+            are not scaled.
+
+    Examples:
+
+        >>> import numpy as np
+        >>> import matplotlib.pyplot as plt
+        >>> from polarchart import get_demodata, radar
+        >>> gsa = get_demodata("gsa")
+        >>> h   = radar(gsa, handle = True, ring_labels = "legend")
+        >>> plt.show(block = False)
+        >>>
+        >>> for i in range(100):
+        >>>     new = gsa * np.random.uniform(0.8, 1.2, size = gsa.shape)
+        >>>     h.update(new)
+        >>>     plt.pause(0.1)
+    """
+
+    def __init__(self, ax, collection, overlay, centers, radius, xmax,
+                 angle, step, columns, limits = None):
+        self.ax          = ax
+        self.collection  = collection
+        self.overlay     = list(overlay)
+        self.centers     = centers
+        self.radius      = radius
+        self.xmax        = xmax
+        self.angle       = angle
+        self.step        = step
+        self.columns     = columns
+        self.limits      = limits
+        self._background = None
+        self._drawing    = False
+        self._cid        = self.figure.canvas.mpl_connect("draw_event", self._on_draw)
+
+    @property
+    def figure(self):
+        """The figure the radar charts are drawn on"""
+        return self.ax.figure
+
+    def set_values(self, values):
+        """Replace the Values
+
+        Recalculates the vertices of all segments and replaces them in the
+        existing collection (without drawing).
+
+        Args:
+            values (pandas.core.frame.DataFrame, numpy.ndarray): New values,
+                same number of rows as the original data. For DataFrames the
+                columns are selected by name, arrays must have one column
+                per segment (same order as the original data). The values
+                are scaled the same way as the original data.
+
+        Returns:
+            matplotlib.collections.PolyCollection : The updated data layer.
+        """
+        from pandas import DataFrame
+        from .geometry import calc_radar_verts
+
+        if self.collection is None:
+            raise ValueError("no radar charts to update (empty data set)")
+
+        if isinstance(values, DataFrame):
+            missing = self.columns.difference(values.columns)
+            if len(missing) > 0:
+                raise ValueError(f"columns missing in 'values': {', '.join(map(str, missing))}")
+            values = values[self.columns].to_numpy(dtype = float)
+        else:
+            values = np.asarray(values, dtype = float)
+        if not values.shape == (self.centers.shape[0], len(self.columns)):
+            raise ValueError(f"argument 'values' must be of shape "
+                             f"({self.centers.shape[0]}, {len(self.columns)})")
+
+        if self.limits is not None:
+            values = (values - self.limits[0]) / self.limits[1]
+
+        verts, _ = calc_radar_verts(values, self.centers,
+                                    radius = self.radius,
+                                    xmax   = self.xmax,
+                                    angle  = self.angle,
+                                    step   = self.step)
+        self.collection.set_verts(verts.reshape(values.size, -1, 2))
+        return self.collection
+
+    def update(self, values, blit = True):
+        """Update the Radar Charts
+
+        Replaces the values (see `set_values()`) and redraws the data layer.
+
+        Args:
+            values (pandas.core.frame.DataFrame, numpy.ndarray): New values,
+                see `set_values()`.
+            blit (bool): If `True` (default) only the data layer is redrawn
+                (blitting). If `False` a redraw of the entire figure is requested.
+        """
+        if not isinstance(blit, bool):
+            raise TypeError("argument 'blit' must be bool")
+        self.set_values(values)
+        if blit:
+            self.blit()
+        else:
+            self.figure.canvas.draw_idle()
+
+    def blit(self):
+        """Redraw the Data Layer
+
+        Restores the cached background and draws the data layer and the
+        overlay on top of it. On the first call (or after the figure has
+        been redrawn entirely) the background is rendered without the data
+        layer and cached.
+        """
+        canvas = self.figure.canvas
+        if not getattr(canvas, "supports_blit", False):
+            canvas.draw_idle()
+            return
+
+        if self._background is None:
+            # Full draw without the data layer and the overlay (drawn
+            # by us below); 'draw_event' is ignored.
+            layers  = [self.collection] + self.overlay
+            visible = [a.get_visible() for a in layers]
+            for a in layers: a.set_visible(False)
+            self._drawing = True
+            try:
+                canvas.draw()
+            finally:
+                self._drawing = False
+                for a, v in zip(layers, visible): a.set_visible(v)
+            self._background = canvas.copy_from_bbox(self.ax.bbox)
+        else:
+            canvas.restore_region(self._background)
+
+        self.ax.draw_artist(self.collection)
+        for a in self.overlay: self.ax.draw_artist(a)
+        canvas.blit(self.ax.bbox)
+
+    def disconnect(self):
+        """Stop listening to draw events and release the background"""
+        self.figure.canvas.mpl_disconnect(self._cid)
+        self._background = None
+
+    def _on_draw(self, event):
+        """Invalidates the background if the figure has been redrawn"""
+        if not self._drawing:
+            self._background = None
+
+    def __repr__(self):
+        return f"RadarHandle({self.centers.shape[0]} charts, {len(self.columns)} segments)"
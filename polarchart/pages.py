@@ -0,0 +1,316 @@
+
+def radar_pages(df, page_size, labels = True, ncol = None, scale = True,
+                color = None, numeric_only = False, **kwargs):
+    """Create Paginated Radar Charts
+
+    Splits the rows of `df` into pages of (at most) `page_size` radar
+    charts each and lazily creates one figure per page. The data are
+    prepared and scaled once so that all pages share the same scaling,
+    colors, and circles. Figures are created via `matplotlib.figure.Figure`
+    (not registered with `matplotlib.pyplot`) and are freed as soon as
+    they are no longer referenced, keeping the memory footprint flat
+    regardless of the number of pages.
+
+    Args:
+        df (pandas.core.frame.DataFrame): A pandas DataFrame with numeric values,
+            see `radar()`.
+        page_size (int): Maximum number of radar charts per page.
+        labels (str, or bool): See `radar()`.
+        ncol (None or int): Number of columns of the grid. If `None` the
+            grid is calculated based on `page_size` and the figure size and
+            is used for all pages.
+        scale (bool): Should the data in 'df' be scaled? If `True` the
+            scaling is based on the entire data set, not on the rows
+            of one page.
+        color (None, list): See `radar()`.
+        numeric_only (bool): See `radar()`.
+        **kwargs: Forwarded to `radar()` (e.g., "circles", "legend_position",
+            "title", "angle", "figsize").
+
+    Returns:
+        generator : Yields one `matplotlib.figure.Figure` per page.
+
+    Examples:
+
+        >>> from matplotlib.backends.backend_pdf import PdfPages
+        >>> from polarchart import get_demodata, radar_pages
+        >>> gsa = get_demodata("gsa")
+        >>>
+        >>> with PdfPages("catalog.pdf") as pdf:
+        >>>     for fig in radar_pages(gsa, page_size = 4, figsize = (8, 6)):
+        >>>         pdf.savefig(fig)
+    """
+
+    setup, df = _prepare_pages(df, page_size, labels, ncol, scale, color,
+                               numeric_only, kwargs, "radar_pages")
+
+    def pages():
+        for i in range(0, df.shape[0], page_size):
+            yield _page_figure(df.iloc[i:(i + page_size)], setup)
+
+    return pages()
+
+
+def export_pages(df, path, page_size, format = "png", processes = None,
+                 progress = None, labels = True, ncol = None, scale = True,
+                 color = None, numeric_only = False, **kwargs):
+    """Export Paginated Radar Charts in Parallel
+
+    Splits the rows of `df` into pages (see `radar_pages()`) and renders
+    them in a pool of worker processes using the non-interactive 'Agg'
+    backend. Each page is written to a numbered file in `path`. Scaling,
+    colors, circles, and the grid are determined once in the calling
+    process such that all pages are consistent.
+
+    Args:
+        df (pandas.core.frame.DataFrame): A pandas DataFrame with numeric values,
+            see `radar()`.
+        path (str): Output directory, created if it does not exist.
+        page_size (int): Maximum number of radar charts per page.
+        format (str): One of "png" (default), "svg", or "pdf".
+        processes (None or int): Number of worker processes. If `None` the
+            number of CPUs is used. If `1` all pages are rendered in the
+            calling process.
+        progress (None or callable): If set, called as `progress(done, total)`
+            each time a page has been written.
+        labels (str, or bool): See `radar()`.
+        ncol (None or int): See `radar_pages()`.
+        scale (bool): See `radar_pages()`.
+        color (None, list): See `radar()`.
+        numeric_only (bool): See `radar()`.
+        **kwargs: Forwarded to `radar()` (e.g., "circles", "legend_position",
+            "title", "angle", "figsize"). Additionally "dpi" (int) is used
+            when saving the figures and "prefix" (str) as the prefix of
+            the file names (defaults to "radar_").
+
+    Returns:
+        list : List of the files written (str), in the order of the pages.
+
+    Examples:
+
+        >>> from polarchart import get_demodata, export_pages
+        >>> gsa = get_demodata("gsa")
+        >>> files = export_pages(gsa, "output", page_size = 4,
+        >>>                      progress = lambda i, n: print(f"{i}/{n}"))
+    """
+
+    dpi, prefix = _check_export_args(path, format, processes, progress, kwargs)
+
+    setup, df = _prepare_pages(df, page_size, labels, ncol, scale, color,
+                               numeric_only, kwargs, "export_pages")
+
+    pages = (df.iloc[i:(i + page_size)] for i in range(0, df.shape[0], page_size))
+    return _export(pages, setup, path, (df.shape[0] + page_size - 1) // page_size,
+                   format, dpi, prefix, processes, progress)
+
+
+def _check_export_args(path, format, processes, progress, kwargs):
+    """Sanity Checks for Exporting Pages
+
+    Returns:
+        list : Returns a list of length two with the resolution and the
+        prefix of the file names, both removed from `kwargs`.
+    """
+    if not isinstance(path, str):
+        raise TypeError("argument 'path' must be str")
+    if not format in ["png", "svg", "pdf"]:
+        raise ValueError("argument 'format' must be one of \"png\", \"svg\", or \"pdf\"")
+    if not isinstance(processes, (type(None), int)):
+        raise TypeError("argument 'processes' must be None or int")
+    if isinstance(processes, int) and processes <= 0:
+        raise ValueError("argument 'processes' (if set) must be a positive integer")
+    if not progress is None and not callable(progress):
+        raise TypeError("argument 'progress' must be None or callable")
+
+    dpi    = kwargs.pop("dpi", 100)
+    prefix = kwargs.pop("prefix", "radar_")
+    if not isinstance(dpi, int):
+        raise TypeError("**kwarg 'dpi' must be int")
+    if not isinstance(prefix, str):
+        raise TypeError("**kwarg 'prefix' must be str")
+    return dpi, prefix
+
+
+def _export(pages, setup, path, npages, format, dpi, prefix, processes, progress):
+    """Render Pages to Files
+
+    Args:
+        pages (iterable): Yields the prepared (scaled) data of each page.
+        setup (dict): Settings as returned by `_prepare_pages()`.
+        npages (int): Number of pages (to number the files).
+
+    Returns:
+        list : List of the files written (str), in the order of the pages.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+    os.makedirs(path, exist_ok = True)
+    digits = len(str(max(1, npages)))
+    files  = [os.path.join(path, f"{prefix}{i + 1:0{digits}d}.{format}") for i in range(npages)]
+    tasks  = ((page, setup, files[i], format, dpi) for i, page in enumerate(pages))
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    done = 0
+    if processes == 1 or npages <= 1:
+        for task in tasks:
+            _export_page(task)
+            done += 1
+            if progress: progress(done, npages)
+        return files
+
+    # Only a limited number of pages is submitted at a time such that
+    # the pending (pickled) pages do not pile up in memory.
+    with ProcessPoolExecutor(max_workers = processes,
+                             initializer = _init_export_worker) as pool:
+        pending = set()
+        for task in tasks:
+            pending.add(pool.submit(_export_page, task))
+            if len(pending) < 2 * processes: continue
+            finished, pending = wait(pending, return_when = FIRST_COMPLETED)
+            for f in finished:
+                f.result() # Raises exceptions from the worker
+                done += 1
+                if progress: progress(done, npages)
+        for f in wait(pending).done:
+            f.result()
+            done += 1
+            if progress: progress(done, npages)
+
+    return files
+
+
+def _prepare_pages(df, page_size, labels, ncol, scale, color, numeric_only,
+                   kwargs, caller):
+    """Prepare Data and Settings for Paginated Plots
+
+    Checks the arguments, prepares and scales the data, and determines the
+    settings shared by all pages (used by `radar_pages()` and `export_pages()`).
+
+    Returns:
+        list : Returns a list of length two where the first element is a
+        dictionary with the settings for `_page_figure()`, the second the
+        prepared DataFrame.
+    """
+
+    from pandas import DataFrame
+    from .utils import prepare_num_df, scale_df
+
+    # -----------------------------------------------------------------
+    # Sanity checks, remaining arguments are checked by radar()
+    # -----------------------------------------------------------------
+    if not isinstance(df, DataFrame):
+        raise TypeError("argument 'df' must be a pandas.DataFrame")
+    _check_page_args(page_size, labels, ncol, scale, color, numeric_only,
+                     kwargs, caller)
+
+    # -----------------------------------------------------------------
+    # Preparing the data once for all pages
+    # -----------------------------------------------------------------
+    # Shallow copy; prepare_num_df() may replace the index.
+    labels, df = prepare_num_df(df.copy(deep = False), labels, numeric_only)
+    df = df.astype(float)
+    if scale:
+        df = scale_df(df, copy = False)
+        xmax = 1
+    else:
+        xmax = df.max().max()
+
+    setup = _page_setup(df.shape, page_size, labels, ncol, color, xmax, kwargs)
+    return setup, df
+
+
+def _check_page_args(page_size, labels, ncol, scale, color, numeric_only,
+                     kwargs, caller):
+    """Sanity Checks for Paginated Plots
+
+    Remaining arguments are checked by `radar()`.
+    """
+    if not isinstance(page_size, int):
+        raise TypeError("argument 'page_size' must be int")
+    if page_size <= 0:
+        raise ValueError("argument 'page_size' must be a positive integer")
+    if not isinstance(labels, (bool, str)):
+        raise TypeError("argument 'labels' must be bool, or str")
+    if not isinstance(ncol, (type(None), int)):
+        raise TypeError("argument 'ncol' must be None or int")
+    if not isinstance(scale, bool):
+        raise TypeError("argument 'scale' must be boolean True (default) or False")
+    if not isinstance(color, (type(None), list)):
+        raise TypeError("argument 'color' must be None or list")
+    if not isinstance(numeric_only, bool):
+        raise TypeError("argument 'numeric_only' must be bool")
+    for k in ["ax", "xmax"]:
+        if k in kwargs:
+            raise ValueError(f"argument '{k}' not allowed in {caller}()")
+
+
+def _page_setup(shape, page_size, labels, ncol, color, xmax, kwargs):
+    """Settings Shared by All Pages
+
+    Args:
+        shape (tuple): Number of rows and columns of the (entire) data set.
+        page_size (int): Maximum number of radar charts per page.
+        labels (bool): Draw labels, as returned by `prepare_num_df()`.
+        ncol (None or int): Number of columns of the grid.
+        color (None or list): Colors of the segments.
+        xmax (float): Value corresponding to the maximum radius.
+        kwargs (dict): Additional arguments forwarded to `radar()`.
+
+    Returns:
+        dict : Settings for `_page_figure()`.
+    """
+    from colorspace import qualitative_hcl
+    from matplotlib.figure import Figure
+    from .utils import axis_get_size, get_gridsize
+
+    if color is None:
+        color = qualitative_hcl("Dynamic")(shape[1])
+
+    kwargs  = dict(kwargs)
+    figsize = kwargs.pop("figsize", (6, 6))
+
+    # Fixing the number of columns based on the size of the axis
+    # (plus one grid cell for the legend) for all pages.
+    if ncol is None:
+        ax = Figure(figsize = figsize).subplots()
+        _, ncol = get_gridsize(axis_get_size(ax), None,
+                               n = min(page_size, shape[0]) + 1)
+
+    return dict(figsize = figsize, labels = labels, ncol = ncol,
+                color = color, xmax = xmax, kwargs = kwargs)
+
+
+def _page_figure(page, setup):
+    """Draw One Page
+
+    Args:
+        page (pandas.core.frame.DataFrame): Prepared (scaled) data for this page.
+        setup (dict): Settings as returned by `_prepare_pages()`.
+
+    Returns:
+        matplotlib.figure.Figure : The figure (not registered with pyplot).
+    """
+    from matplotlib.figure import Figure
+    from .radar import radar
+
+    fig = Figure(figsize = setup["figsize"])
+    radar(page, labels = setup["labels"], ax = fig.subplots(),
+          ncol = setup["ncol"], scale = False, color = setup["color"],
+          xmax = setup["xmax"], **setup["kwargs"])
+    return fig
+
+
+def _init_export_worker():
+    """Initialize Worker Process; non-interactive backend"""
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def _export_page(task):
+    """Render One Page to File (executed in the worker processes)"""
+    page, setup, file, format, dpi = task
+    _page_figure(page, setup).savefig(file, format = format, dpi = dpi)
+    return file
@@ -1,12 +1,19 @@
 
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 from matplotlib.patches import Polygon
-from colorspace import qualitative_hcl
+from matplotlib.collections import PolyCollection
+from matplotlib.path import Path
+from functools import lru_cache
+from .stats import instrumented
 
+# Note: matplotlib.pyplot (initializes a backend) and colorspace are
+# only imported when needed.
+
+@instrumented
 def radar(df, labels = True, ax = None, ncol = None, scale = True, circles = True,
-          legend_position = None, color = None, numeric_only = False, **kwargs):
+          legend_position = None, color = None, numeric_only = False,
+          collection = True, output = None, **kwargs):
     """Create radar charts.
 
     Args:
@@ -34,13 +41,27 @@ def radar(df, labels = True, ax = None, ncol = None, scale = True, circles = Tru
             be used. Can be a list of valid colors/hex colors.
         numeric_only (bool): Defaults to `False`, if set `True` all non-numeric
             columns/variables will be excluded.
+        collection (bool): If `True` (default) all segments of all radar charts
+            are drawn as one single `matplotlib.collections.PolyCollection`,
+            keeping the number of artists constant regardless of the number
+            of rows in `df`. If `False` one `matplotlib.patches.Polygon` is
+            added per segment (slow for large data sets).
+        output (None or str): If `None` (default) the plot is shown if no
+            axis is provided (`ax = None`). If set to "figure" a standalone
+            `matplotlib.figure.Figure` is created (without using
+            `matplotlib.pyplot`) and returned. If "png", "svg", or "pdf"
+            the figure is rendered into an in-memory buffer and the encoded
+            image is returned (bytes). Safe to be used in headless
+            environments and worker threads.
         **kwargs:
             Additional keyword arguments, see Details for more information.
 
     Returns:
         If `ax = None` (no custom axis provided) there is no return but
         the plot created will be shown. If a custom axis is used the
-        (modified) axis is returned.
+        (modified) axis is returned. If `output` is set, the figure
+        (`output = "figure"`) or the encoded image (bytes) is returned.
+        If `handle = True` (see Details) a `RadarHandle` is returned.
 
     Details:
 
@@ -48,6 +69,54 @@ def radar(df, labels = True, ax = None, ncol = None, scale = True, circles = Tru
         - "title" (str): Plot title
         - "angle" (int, float): Rotation angle in degrees.
         - "figsize" (tuple): Custom figure size, ignored if an axis ('ax') is provided.
+        - "dpi" (int): Resolution used when `output` is "png", "svg", or "pdf".
+        - "ring_labels" (bool, str): If `True` (default) the values of the
+          circles are added to each radar chart. If "legend" the circles and
+          their values are only shown once in the legend, `False` suppresses
+          the labels. Ignored if `circles = False`.
+        - "fast_labels" (bool): If `True` the labels of all radar charts are
+          drawn as one single collection of text paths instead of one text
+          artist per radar chart. Much faster for a large number of rows,
+          however, the labels are drawn as paths (not selectable as text
+          in vector graphics). Defaults to `False`.
+        - "lod" (bool, float): Level of detail. If `False` (default) the arcs
+          of the segments use a fixed resolution of 2 degrees and the circles
+          180 points. If `True` the number of vertices is derived from the
+          size of one grid cell on the rendered figure (pixels, considering
+          the resolution; points for "svg" and "pdf" output) such that the
+          polygons deviate at most 0.25 pixels from the true arcs. A
+          positive float can be used to set a custom tolerance (in pixels).
+        - "rasterized" (bool): If `True` the segments, circles, and the legend
+          polygons are rasterized into one single image when saving to a
+          vector format ("svg", "pdf") while labels and title are kept as
+          text. The size of the output depends on the size of the figure and
+          the resolution ("dpi") instead of the number of rows. For purely
+          vector output see "lod" to limit the number of vertices.
+          Defaults to `False`.
+        - "cache" (bool, MemoryCache, DiskCache): Opt-in memoization if
+          `output` is "png", "svg", or "pdf" (and `ax = None`). The rendered image is stored in
+          the cache, keyed by a hash of the data (values, index, columns)
+          and all arguments. Repeated calls with unchanged data and
+          arguments return the cached image without rendering. If `True` a
+          shared in-memory cache is used (see `cache.default_cache()`).
+          Defaults to `False`.
+        - "stats" (RenderStats): Opt-in instrumentation; if set, the object
+          is filled with the time spent in each phase, the number of artists
+          and vertices, and (optionally) the peak memory, see `RenderStats`.
+        - "xmax" (int, float): Value corresponding to the maximum radius of
+          the segments and used to calculate the circles. Defaults to `1` if
+          `scale = True`, else the overall maximum of `df`. Allows to use the
+          same scaling across multiple charts (see e.g., `radar_pages()`).
+        - "handle" (bool): If `True` a `RadarHandle` is returned (instead of
+          showing the plot or returning the axis) which allows to update
+          the values in-place and to redraw the segments only (blitting),
+          e.g., for live dashboards. Requires `collection = True`, not
+          allowed in combination with "png", "svg", or "pdf" output.
+        - "virtual" (bool): If `True` only the radar charts inside the
+          current view of the axis are drawn (see `VirtualGrid`). The artists
+          are updated when panning or zooming such that the view stays
+          responsive regardless of the number of rows. Requires
+          `collection = True`, defaults to `False`.
 
     Examples:
 
@@ -73,6 +142,13 @@ def radar(df, labels = True, ax = None, ncol = None, scale = True, circles = Tru
     from pandas import DataFrame
     from matplotlib import axes
     from .utils import prepare_num_df
+    from .stats import RenderStats, NULL_STATS, log
+
+    # Instrumentation is opt-in; the dummy object does nothing
+    stats = NULL_STATS if not "stats" in kwargs else kwargs["stats"]
+    if not isinstance(stats, (RenderStats, type(NULL_STATS))):
+        raise TypeError("**kwarg 'stats' must be a RenderStats object")
+    stats.phase("validation")
 
     # -----------------------------------------------------------------
     # Sanity checks
@@ -95,8 +171,30 @@ def radar(df, labels = True, ax = None, ncol = None, scale = True, circles = Tru
         raise TypeError("argument 'color' must be None or list")
     if not isinstance(numeric_only, bool):
         raise TypeError("argument 'numeric_only' must be bool")
+    if not isinstance(collection, bool):
+        raise TypeError("argument 'collection' must be bool")
+    if not output in [None, "figure", "png", "svg", "pdf"]:
+        raise ValueError("argument 'output' must be None, \"figure\", \"png\", \"svg\", or \"pdf\"")
     if legend_position is None: legend_position = True
 
+    # Memoization (opt-in); returns the cached image if available
+    cache = False if not "cache" in kwargs else kwargs["cache"]
+    if cache is not False:
+        from .cache import MemoryCache, DiskCache, default_cache, render_key
+        if cache is True: cache = default_cache()
+        if not isinstance(cache, (MemoryCache, DiskCache)):
+            raise TypeError("**kwarg 'cache' must be bool, MemoryCache, or DiskCache")
+        if not output in ["png", "svg", "pdf"] or ax is not None:
+            raise ValueError("**kwarg 'cache' requires output \"png\", \"svg\", or \"pdf\" and 'ax = None'")
+        cache_key = render_key(df, labels, ncol, scale, circles, legend_position,
+                               color, numeric_only, collection, output,
+                               sorted((k, v) for k, v in kwargs.items() if not k in ["cache", "stats"]))
+        res = cache.get(cache_key)
+        if res is not None:
+            stats.count("cache hits", 1)
+            stats.stop()
+            return res
+
     # Value checks
     if isinstance(ncol, int) and ncol <= 0:
         raise ValueError("argument 'nrow' (if set) must be a positive integer")
@@ -108,6 +206,7 @@ def radar(df, labels = True, ax = None, ncol = None, scale = True, circles = Tru
 
     # Set of colors
     if color is None:
+        from colorspace import qualitative_hcl
         color = qualitative_hcl("Dynamic")(df.shape[1])
 
     # -----------------------------------------------------------------
@@ -123,6 +222,57 @@ def radar(df, labels = True, ax = None, ncol = None, scale = True, circles = Tru
             raise TypeError("**kwarg 'angle' must be str")
     angle = 0 if not "angle" in kwargs else kwargs["angle"]
 
+    if "dpi" in kwargs:
+        if not isinstance(kwargs["dpi"], int):
+            raise TypeError("**kwarg 'dpi' must be int")
+    dpi = 100 if not "dpi" in kwargs else kwargs["dpi"]
+
+    if "ring_labels" in kwargs:
+        if not isinstance(kwargs["ring_labels"], (bool, str)):
+            raise TypeError("**kwarg 'ring_labels' must be bool or str")
+        if isinstance(kwargs["ring_labels"], str) and not kwargs["ring_labels"] == "legend":
+            raise ValueError("**kwarg 'ring_labels' must be bool or \"legend\"")
+    ring_labels_mode = True if not "ring_labels" in kwargs else kwargs["ring_labels"]
+
+    if "fast_labels" in kwargs:
+        if not isinstance(kwargs["fast_labels"], bool):
+            raise TypeError("**kwarg 'fast_labels' must be bool")
+    fast_labels = False if not "fast_labels" in kwargs else kwargs["fast_labels"]
+
+    if "lod" in kwargs:
+        if not isinstance(kwargs["lod"], (bool, int, float)):
+            raise TypeError("**kwarg 'lod' must be bool or float")
+        if not isinstance(kwargs["lod"], bool) and not kwargs["lod"] > 0:
+            raise ValueError("**kwarg 'lod' must be positive if numeric")
+    lod = False if not "lod" in kwargs else kwargs["lod"]
+    lod = 0.25 if lod is True else lod
+
+    if "rasterized" in kwargs:
+        if not isinstance(kwargs["rasterized"], bool):
+            raise TypeError("**kwarg 'rasterized' must be bool")
+    rasterized = False if not "rasterized" in kwargs else kwargs["rasterized"]
+
+    if "xmax" in kwargs:
+        if not isinstance(kwargs["xmax"], (int, float)):
+            raise TypeError("**kwarg 'xmax' must be int or float")
+        if not kwargs["xmax"] > 0:
+            raise ValueError("**kwarg 'xmax' must be positive")
+
+    if "handle" in kwargs:
+        if not isinstance(kwargs["handle"], bool):
+            raise TypeError("**kwarg 'handle' must be bool")
+    handle = False if not "handle" in kwargs else kwargs["handle"]
+    if handle and not collection:
+        raise ValueError("**kwarg 'handle' requires 'collection = True'")
+    if handle and not output in [None, "figure"]:
+        raise ValueError("**kwarg 'handle' can only be used with output None or \"figure\"")
+
+    if "virtual" in kwargs:
+        if not isinstance(kwargs["virtual"], bool):
+            raise TypeError("**kwarg 'virtual' must be bool")
+    virtual = False if not "virtual" in kwargs else kwargs["virtual"]
+    if virtual and (handle or not collection):
+        raise ValueError("**kwarg 'virtual' requires 'collection = True' and cannot be combined with 'handle'")
 
     # Default radius used for scaling. 0.5 means that the segments of
     # neighboring radar charts would touch (if x == 1); so we use
@@ -134,59 +284,64 @@ def radar(df, labels = True, ax = None, ncol = None, scale = True, circles = Tru
     # Preparing data
     # -----------------------------------------------------------------
 
-    # [!] First and formost: make a local copy of df to avoid
-    # messing with the users object (avoiding scoping and infix operations)
-    df = df.copy()
+    stats.phase("prepare")
 
     # Return logical True/False if labels should be drawn later, and the modified
     # data set if everything goes well. Else prepare_data() will throw errors
-    # and hints.
+    # and hints. Note: the users object is never modified by prepare_num_df()
+    # nor below, wherefore no copy of 'df' is needed.
     labels, df = prepare_num_df(df, labels, numeric_only)
 
-    print(df)
-
-    # Preparing the data frame
-    df = df.astype(float)
+    log.debug("radar(): %d rows, %d columns", df.shape[0], df.shape[1])
+    if len(color) < df.shape[1]:
+        raise ValueError("argument 'color' must contain (at least) one color per column")
+
+    # Preparing the data; only converted (copied) if needed. If converted,
+    # the values are written once into a new (writeable) array which is
+    # then scaled in-place (DataFrames are read-only under copy-on-write).
+    converted = not (df.dtypes == float).all()
+    if converted:
+        x = df.to_numpy(dtype = float, copy = True)
+    stats.phase("scale")
+    limits = None
+    if scale:
+        from .utils import scale_df, scale_limits
+        limits = scale_limits(x if converted else df)
+        if converted:
+            scale_df(x, copy = False, limits = limits)
+        else:
+            df = scale_df(df, limits = limits)
+    if converted:
+        df = DataFrame(x, index = df.index, columns = df.columns, copy = False)
     if scale:
-        from .utils import scale_df
-        df = scale_df(df)
         # After scaling max raduis (normalized) is 1
         df_max = 1
     else:
         # Else we take the overall maximum for scaling the polygons and circles
         df_max = df.max().max()
+    # Custom maximum (e.g., to keep the scaling across several plots)
+    if "xmax" in kwargs:
+        df_max = kwargs["xmax"]
 
+    stats.phase("layout")
     if ax is None:
         figsize = (6, 6) if not "figsize" in kwargs else kwargs["figsize"]
-        fig, ax = plt.subplots(figsize = figsize)
+        if output is None:
+            # Figure to be shown; the only place where pyplot is needed
+            import matplotlib.pyplot as plt
+            fig, ax = plt.subplots(figsize = figsize)
+        else:
+            # Standalone figure, not registered with pyplot
+            from matplotlib.figure import Figure
+            fig = Figure(figsize = figsize)
+            ax  = fig.subplots()
     else:
         fig = None # Dummy which indicates the user provided an axis
 
     # Determine size of the axis to find the best placement/grid for the plots
-    def axis_get_size(ax):
-        # Get axis position (relative) and scale it with figure size
-        bbox = ax.get_position()
-        fig_w, fig_h = ax.figure.get_size_inches()
-        ax_h = bbox.height * fig_h
-        ax_w = bbox.width  * fig_w
-        ##print(f"Current axis size:     height = {ax_h}, width = {ax_w}")
-        return((ax_h, ax_w))
-
+    from .utils import axis_get_size, get_gridsize
     axsize = axis_get_size(ax)
 
-    # Calculating x/y positions; number of df-rows + 1 to always have the
-    # very last space empty to draw the legend.
-    def get_gridsize(axsize, ncol, n):
-        # If 'ncol' is an integer the job is easy
-        if ncol is not None:
-            nrow = int(np.ceil(n / ncol))
-            return nrow, ncol
-        # Else we guess based on the aspect ratio of the axis
-        asp  = float(axsize[1] / axsize[0])
-        nrow = int(np.round(np.sqrt(n / asp)))
-        ncol = int(np.ceil(n / nrow))
-        return nrow, ncol
-
     # Has the user set a custom legend position?
     custom_legend_position = True if isinstance(legend_position, tuple) else False
 
@@ -229,53 +384,138 @@ def radar(df, labels = True, ax = None, ncol = None, scale = True, circles = Tru
     ax.invert_yaxis()
     ax.set_aspect('equal')
 
+    # All patches and collections (zorder 1) are rasterized together
+    # into one image, text (zorder 3) stays vector.
+    if rasterized:
+        ax.set_rasterization_zorder(2)
+
+    # Level of detail: angular resolution of the arcs based on the
+    # size of one grid cell (data unit) on the rendered figure.
+    seg_step = 2 * np.pi / 180
+    circle_n = 180
+    if lod is not False:
+        from .geometry import calc_arc_step
+        xlim, ylim = ax.get_xlim(), ax.get_ylim()
+        # Vector output is measured in points (72 per inch)
+        res = 72 if output in ["svg", "pdf"] else dpi if output == "png" else ax.figure.dpi
+        ppu = min(axsize[1] / abs(xlim[1] - xlim[0]), axsize[0] / abs(ylim[1] - ylim[0])) * res
+        seg_step = calc_arc_step(radius * ppu, lod)
+
     # x/y are the positionas as well as the indices!
     col_index = np.reshape(range(ncol * nrow), (nrow, ncol), order = "C")
-    #print(col_index)
 
     # ---------------------------------------------------------------
     # Adding 'data' (drawing the different radar plots)
     # ---------------------------------------------------------------
-    for x in range(ncol):
-        for y in range(nrow):
-            idx = col_index[y, x]
-            ## If 'idx >= df.shape[0]' this is an empty cell (as we
-            ## reserve at least one for the legend).
-            if idx >= df.shape[0]: continue # Empty grid cell, continue
-
-            ## Calculating polygons for segments as well as label positions
-            polygons, polylabels = calc_radar_coords(df.iloc[idx, :],
-                                                     center = (x, y),
-                                                     color  = color,
-                                                     radius = radius,
-                                                     xmax   = df_max,
-                                                     angle  = angle)
-            ## Draw polygons
-            for p in polygons.values(): ax.add_patch(p)
-
-            ## Adding labels if requested. Suppressing labels
-            ## is not a common usecase but available as an option.
-            if labels:
-                ax.text(x, y + 0.5, df.index[idx], ha = "center",
-                        va = "bottom" if idx % 2 == 0 else "top")
-
-            if circles:
-                # First we calculate what "useful" circles would be by
-                # checking the overall maximum of 'df' and then set up
-                # a vector with circles to draw; always on one digit
-                # after the decimal sign as the polylabels currently
-                # use ".1f" (rounded to closest 0.1).
-                from .utils import pretty_ticks
-                at     = pretty_ticks(df_max, 4)
-                polygons, polylabels = get_circle_coords(center = (x, y),
-                                                         radius = radius,
-                                                         at     = at,
-                                                         xmax   = df_max)
-                for k,p in polygons.items():
-                    ax.add_patch(p)
-                    ax.text(x = polylabels[k][0], y = polylabels[k][1], s = k,
-                            ha = "center", va = "center", color = "gray",
-                            fontsize = 6)
+    # Grid position (center) of each radar chart
+    idx     = np.arange(df.shape[0])
+    centers = np.column_stack([idx % ncol, idx // ncol])
+
+    # If 'collection = True' the vertices of all segments of all radar
+    # charts are calculated at once and drawn as one single PolyCollection.
+    data_coll = None
+    overlay   = [] # Artists on top of the data layer (see 'handle')
+    if collection and df.shape[0] > 0 and not virtual:
+        from .geometry import calc_radar_verts
+        stats.phase("geometry")
+        verts, _ = calc_radar_verts(df.to_numpy(), centers,
+                                    radius = radius,
+                                    xmax   = df_max,
+                                    angle  = angle,
+                                    step   = seg_step)
+        stats.phase("artists")
+        data_coll = PolyCollection(verts.reshape(df.size, -1, 2),
+                                   closed     = True,
+                                   facecolors = color[:df.shape[1]] * df.shape[0],
+                                   edgecolors = "gray",
+                                   linewidths = 0.5)
+        ax.add_collection(data_coll, autolim = False)
+
+    stats.phase("artists")
+
+    # Reference circles. First we calculate what "useful" circles would be by
+    # checking the overall maximum of 'df' and then set up a vector with
+    # circles to draw. The circles are only calculated once and placed at
+    # the center of each radar chart.
+    if circles:
+        from .utils import pretty_ticks
+        from .geometry import calc_circle_verts
+        at = pretty_ticks(df_max, 4)
+        if lod is not False:
+            # Number of points needed for the largest circle
+            circle_n = int(np.ceil(2 * np.pi / calc_arc_step(max(at) * radius * ppu / df_max, lod))) + 1
+        if collection and df.shape[0] > 0 and not virtual:
+            ring_coll, ring_labels = get_circle_collection(ax, centers,
+                                                           radius = radius,
+                                                           at     = at,
+                                                           xmax   = df_max,
+                                                           n      = circle_n)
+            ax.add_collection(ring_coll, autolim = False)
+            overlay.append(ring_coll)
+        else:
+            _, ring_labels = calc_circle_verts(radius, at, df_max)
+
+    # Virtual grid: only the radar charts in the current view are drawn
+    # (updated on pan/zoom); else the artists of all cells are created.
+    if virtual and df.shape[0] > 0:
+        from .virtual import VirtualGrid
+        VirtualGrid(ax, df.to_numpy(dtype = float), centers,
+                    names       = [str(x) for x in df.index] if labels else None,
+                    color       = color,
+                    radius      = radius,
+                    xmax        = df_max,
+                    angle       = angle,
+                    step        = seg_step,
+                    at          = at if circles else None,
+                    ring_labels = ring_labels_mode is True,
+                    fast_labels = fast_labels,
+                    circle_n    = circle_n)
+    else:
+        for x in range(ncol):
+            for y in range(nrow):
+                idx = col_index[y, x]
+                ## If 'idx >= df.shape[0]' this is an empty cell (as we
+                ## reserve at least one for the legend).
+                if idx >= df.shape[0]: continue # Empty grid cell, continue
+
+                ## Calculating polygons for segments as well as label positions
+                if not collection:
+                    polygons, polylabels = calc_radar_coords(df.iloc[idx, :],
+                                                             center = (x, y),
+                                                             color  = color,
+                                                             radius = radius,
+                                                             xmax   = df_max,
+                                                             angle  = angle)
+                    ## Draw polygons
+                    for p in polygons.values(): ax.add_patch(p)
+
+                ## Adding labels if requested. Suppressing labels
+                ## is not a common usecase but available as an option.
+                if labels and not fast_labels:
+                    ax.text(x, y + 0.5, df.index[idx], ha = "center",
+                            va = "bottom" if idx % 2 == 0 else "top")
+
+                if circles and not collection:
+                    polygons, polylabels = get_circle_coords(center = (x, y),
+                                                             radius = radius,
+                                                             at     = at,
+                                                             xmax   = df_max)
+                    for k,p in polygons.items():
+                        ax.add_patch(p)
+
+                # Labels for the circles, positions relative to the center
+                if circles and ring_labels_mode is True:
+                    for k,p in ring_labels.items():
+                        overlay.append(ax.text(x = x + p[0], y = y + p[1], s = k,
+                                               ha = "center", va = "center", color = "gray",
+                                               fontsize = 6))
+
+    # All labels at once as one collection (see 'fast_labels')
+    if labels and fast_labels and df.shape[0] > 0 and not virtual:
+        ax.add_collection(get_label_collection(ax, centers + [0, 0.5],
+                                               s  = [str(x) for x in df.index],
+                                               va = np.where(np.arange(df.shape[0]) % 2 == 0, "bottom", "top")),
+                          autolim = False)
 
     # ---------------------------------------------------------------
     # Adding legend
@@ -294,6 +534,18 @@ def radar(df, labels = True, ax = None, ncol = None, scale = True, circles = Tru
             ax.text(x = polylabels[k][0], y = polylabels[k][1], s = k,
                     ha = "center", va = "center", fontsize = 7)
 
+        # Showing the circles and their values once (on top of the legend)
+        if circles and ring_labels_mode == "legend":
+            polygons, polylabels = get_circle_coords(center = legend_position,
+                                                     radius = 0.25,
+                                                     at     = at,
+                                                     xmax   = df_max)
+            for k,p in polygons.items():
+                ax.add_patch(p)
+                ax.text(x = polylabels[k][0], y = polylabels[k][1], s = k,
+                        ha = "center", va = "center", color = "gray",
+                        fontsize = 6)
+
     # ---------------------------------------------------------------
     # Adjusting axis and show plot (if required)
     # ---------------------------------------------------------------
@@ -301,14 +553,124 @@ def radar(df, labels = True, ax = None, ncol = None, scale = True, circles = Tru
     ax.spines["top"].set_visible(False)
     ax.set_title(title)
 
+    # Handle for in-place updates (instead of showing the plot)
+    if handle:
+        from .handle import RadarHandle
+        stats.stop(ax)
+        return RadarHandle(ax, data_coll, overlay, centers,
+                           radius  = radius,
+                           xmax    = df_max,
+                           angle   = angle,
+                           step    = seg_step,
+                           columns = df.columns,
+                           limits  = limits)
+
+    # Headless mode: return the figure or the encoded image
+    if output == "figure":
+        stats.stop(ax)
+        return ax.figure
+    elif output is not None:
+        from io import BytesIO
+        stats.phase("draw")
+        buf = BytesIO()
+        ax.figure.savefig(buf, format = output, dpi = dpi)
+        stats.stop(ax)
+        if cache is not False: cache.put(cache_key, buf.getvalue())
+        return buf.getvalue()
+
     # If 'fig = None' the user provided their own axis ('ax = ...'),
     # in this case we just return the axis. Else we show the plot.
+    stats.stop(ax)
     if fig is not None:
+        import matplotlib.pyplot as plt
         plt.show()
     else:
         return ax
 
 
+def radar_array(values, index = None, columns = None, **kwargs):
+    """Create Radar Charts from Arrays
+
+    Low-level entry point to `radar()` for large data sets. Takes a
+    two-dimensional numeric array, a `pyarrow.Table`, or a
+    `pandas.DataFrame` and reads the data without copying whenever
+    possible (numeric columns are selected based on the dtypes only).
+    The peak memory stays close to the size of the input plus
+    the scaled values (if `scale = True`).
+
+    Args:
+        values (numpy.ndarray, pyarrow.Table, pandas.core.frame.DataFrame):
+            Two-dimensional array with one row per radar chart and one
+            column per segment (read without copying if it is a float64
+            array). For `pyarrow.Table`s the numeric columns are gathered
+            into one column-major array (one copy) as the columns are stored
+            in separate buffers. For `pandas.DataFrame`s the numeric columns
+            are used; selecting a subset of the columns and the `labels`
+            argument of `radar()` only avoid copies with copy-on-write
+            enabled (default as of pandas 3.0, else
+            `pandas.set_option("mode.copy_on_write", True)`).
+        index (None or list): Labels of the radar charts (length equal to
+            the number of rows). If `None` the row numbers are used (arrays,
+            tables) or the index (DataFrame).
+        columns (None or list): Names of the segments (length equal to the
+            number of columns). If `None` the column names are used (tables,
+            DataFrames) or `0, 1, ...` for arrays.
+        **kwargs: Forwarded to `radar()`.
+
+    Returns:
+        See `radar()`.
+
+    Examples:
+
+        >>> import numpy as np
+        >>> from polarchart import radar_array
+        >>> x = np.random.uniform(size = (20, 5))
+        >>> radar_array(x, index = [f"obs {i}" for i in range(20)],
+        >>>             columns = list("ABCDE"))
+    """
+    from pandas import DataFrame
+    from pandas.api.types import is_numeric_dtype
+
+    if "numeric_only" in kwargs:
+        raise ValueError("argument 'numeric_only' not allowed in radar_array()")
+
+    # pyarrow.Table (duck typing; pyarrow is an optional dependency)
+    if hasattr(values, "column_names") and hasattr(values, "to_pandas"):
+        import pyarrow.types as pat
+        num = [i for i, f in enumerate(values.schema) if pat.is_integer(f.type) or pat.is_floating(f.type)]
+        if columns is None:
+            columns = [values.column_names[i] for i in num]
+        # Column-major; each column is written once into the final array
+        x = np.empty((values.num_rows, len(num)), dtype = float, order = "F")
+        for j, i in enumerate(num):
+            x[:, j] = values.column(i).to_numpy()
+        values = x
+    elif isinstance(values, DataFrame):
+        isnum = np.fromiter((is_numeric_dtype(d) for d in values.dtypes), dtype = bool,
+                            count = values.shape[1])
+        if not isnum.all(): values = values.iloc[:, isnum]
+        # New labels on a shallow copy (set_axis() copies the data
+        # without copy-on-write)
+        if index is not None or columns is not None:
+            values = values.copy(deep = False)
+            if index is not None:   values.index = index
+            if columns is not None: values.columns = columns
+        return radar(values, **kwargs)
+
+    # Two-dimensional array; only converted if not float
+    values = np.asarray(values, dtype = float)
+    if not values.ndim == 2:
+        raise ValueError("argument 'values' must be two-dimensional")
+    if index is not None and not len(index) == values.shape[0]:
+        raise ValueError("length of 'index' does not match the number of rows")
+    if columns is not None and not len(columns) == values.shape[1]:
+        raise ValueError("length of 'columns' does not match the number of columns")
+
+    # Wrapping the array without copying it
+    return radar(DataFrame(values, index = index, columns = columns, copy = False),
+                 **kwargs)
+
+
 def calc_radar_coords(x, center, color, radius, xmax, angle = 0,
                       edgecolor = "gray", linewidth = 0.5):
     """calc_radar_coords(x, center, color, radius, angle = 0, edgecolor = "gray", linewidth = 0.5)
@@ -349,44 +711,56 @@ def calc_radar_coords(x, center, color, radius, xmax, angle = 0,
         to the '(x, y)' coordinates to position the labels. The dict keys correspond
         to the labels (properties) of the different segments.
     """
-    ## Offset of 0.45 ensures that the segments can all be drawn
-    ## on a grid of 1 by 1 (x == 1 results in a radius of 'radius'
-    ## Additional rotation; angle is in degrees, convert to radiant
-    anglerad = angle / 180 * np.pi
-    ## Rough radius interval (the smaller the 'rounder')
-    radi   = 2 * np.pi / 180
-    ## Zero coordinate point
-    zero   = np.array([0])
-    ## Angles for the arc (radiant)
-    theta  = np.linspace(0, -2 * np.pi, len(x) + 1) + anglerad
-
-    ## Middle of the theta segments, used for legend positioning
-    theta_mids = (theta[:-1] + theta[1:]) / 2.0
-
-    ## Resulting dictionary
-    result = dict()
-    labels = dict()
+    verts, labels = calc_segment_verts(x, center, radius, xmax, angle)
 
-    ## Create Polygon for each of the segments
+    ## Setting up matplotlib.patches.Polygon for each of the segments
+    result = dict()
     for i in range(len(x)):
-        angle = np.hstack([np.linspace(theta[i], theta[i + 1],
-                                       int(abs(theta[i + 1] - theta[i]) // radi))])
-        # 0.45 so that x[i] = 1 corresponds to a radius of 0.45,
-        # allowing all radar plots to exist next to each other
-        # on a 1x1 grid.
-        arc_x = center[0] + x.iloc[i] * radius * np.cos(angle) / xmax
-        arc_y = center[1] + x.iloc[i] * radius * np.sin(angle) / xmax
-        arc   = np.vstack([center, np.column_stack([arc_x, arc_y])])
-        # Setting up matplotlib.patches.Polygon
-        result[x.index[i]] = Polygon(arc,
+        result[x.index[i]] = Polygon(verts[i],
                                      closed = True,
                                      facecolor = color[i],
                                      edgecolor = edgecolor,
                                      linewidth = linewidth)
 
-        # Calculating label position
-        labels[x.index[i]] = (center[0] + 1.4 * radius * np.cos(theta_mids[i]),
-                              center[1] + 1.4 * radius * np.sin(theta_mids[i]))
+    return result, dict(zip(x.index, labels))
+
+
+def calc_segment_verts(x, center, radius, xmax, angle = 0):
+    """calc_segment_verts(x, center, radius, xmax, angle = 0)
+
+    Calculates the vertices of the segments of one radar chart without
+    creating any matplotlib artists; used by `calc_radar_coords()` and
+    when drawing all segments as one collection.
+
+    Args:
+        x : pandas.core.series.Series
+            A pandas series with numeric values.
+        center : tuple
+            Tuple with two numeric values defining the center.
+        radius : float
+            Radius of the segments, see `calc_radar_coords()`.
+        xmax : num
+            Additional scaling factor, see `calc_radar_coords()`.
+        angle : float or int
+            Rotation angle (in degrees), defaults to '0'.
+
+    Returns:
+        list of lists : Returns two lists of the same length as `x`. The first
+        one contains a `numpy.ndarray` of shape `(n, 2)` with the vertices of
+        each segment, the second one a tuple with the `(x, y)` coordinates of
+        the corresponding label.
+    """
+    from .geometry import calc_radar_verts, calc_label_coords
+
+    ## Single-row version of calc_radar_verts(); all segments consist
+    ## of the same number of vertices.
+    verts, _ = calc_radar_verts(np.asarray(x, dtype = float).reshape(1, -1),
+                                centers = [center],
+                                radius  = radius,
+                                xmax    = xmax,
+                                angle   = angle)
+    result = list(verts.reshape(len(x), -1, 2))
+    labels = [tuple(l) for l in calc_label_coords(len(x), center, radius, angle)]
 
     return result, labels
 
@@ -414,33 +788,161 @@ def get_circle_coords(center, radius, at, xmax):
         each of which defines one circle. The dict keys are used
         as labels when drawn.
     """
-    n        = 180 # Aumber of points along the polygon
-    theta    = np.linspace(0, -2 * np.pi, 180) # Calculating angles
-    anglerad = -45 / 180 * np.pi
+    from .geometry import calc_circle_verts
 
-    # Number of significant digits needed
-    digits = max(0, int((-np.floor(np.log10(np.asarray(at)))).max()))
+    # Circles are calculated around (0, 0) and shifted to 'center'
+    verts, labels = calc_circle_verts(radius, at, xmax)
 
-    labels = dict()
     result = dict()
-    for a in at:
-        hash = f"{a:.{digits}f}"
-        # Multiply by radius for proper scaling
-        arc_x  = center[0] + a * radius * np.cos(theta) / xmax
-        arc_y  = center[1] + a * radius * np.sin(theta) / xmax
-        circle = np.column_stack([arc_x, arc_y])
-
+    for hash, circle in zip(labels.keys(), verts):
         # Setting up matplotlib.patches.Polygon
-        result[hash] = (Polygon(circle,
+        result[hash] = (Polygon(circle + np.asarray(center),
                                 closed    = True,
                                 fill      = False,
                                 edgecolor = "gray",
                                 linestyle = (0, (6, 7)), # loosely dashed
                                 linewidth = 0.5))
-        labels[hash] = (center[0] + a * radius * np.cos(anglerad) / xmax,
-                        center[1] + a * radius * np.sin(anglerad) / xmax)
+        labels[hash] = (center[0] + labels[hash][0], center[1] + labels[hash][1])
 
     return result, labels
 
 
+def get_circle_collection(ax, centers, radius, at, xmax, n = 180):
+    """Reference Circles as one Collection
+
+    Calculates the reference circles once (see `calc_circle_verts()`)
+    and places them at all `centers` using offsets. Instead of one
+    `matplotlib.patches.Polygon` per circle and radar chart a single
+    `matplotlib.collections.PathCollection` is created.
+
+    Args:
+        ax (matplotlib.axes._axes.Axes): The axis the collection will be
+            added to, used to set up the transformations.
+        centers (numpy.ndarray): Array of shape `(n, 2)` with the centers
+            of the radar charts.
+        radius (num): Positive numeric, maximum radius.
+        at (list): List of numeric values for which a circle should be drawn.
+        xmax (num): Additional scaling factor, see `get_circle_coords()`.
+        n (int): Number of points along each circle, defaults to '180'.
+
+    Returns:
+        list : Returns a list of length two. The first element is the
+        `matplotlib.collections.PathCollection` (not yet added to `ax`), the
+        second one a dictionary with the `(x, y)` coordinates of the labels
+        relative to the center of the radar chart (see `calc_circle_verts()`).
+    """
+    from matplotlib.path import Path
+    from matplotlib.collections import PathCollection
+    from matplotlib.transforms import AffineDeltaTransform
+    from .geometry import calc_circle_verts
+
+    verts, labels = calc_circle_verts(radius, at, xmax, n = n)
+
+    # All circles combined into one compound path (the template). The vertices
+    # are scaled (but not shifted) by the data transformation while
+    # the offsets take care of placing the template at each center.
+    template = Path.make_compound_path(*[Path(v, closed = True) for v in verts])
+    coll = PathCollection([template],
+                          offsets          = np.asarray(centers, dtype = float),
+                          offset_transform = ax.transData,
+                          transform        = AffineDeltaTransform(ax.transData),
+                          facecolors       = "none",
+                          edgecolors       = "gray",
+                          linestyles       = [(0, (6, 7))], # loosely dashed
+                          linewidths       = 0.5)
+
+    return coll, labels
+
+
+def get_label_collection(ax, xy, s, va, fontsize = None, color = "black"):
+    """Labels as one Collection
+
+    Converts all labels into text paths (`matplotlib.textpath.TextPath`)
+    and combines them in one single `matplotlib.collections.PathCollection`,
+    which is much cheaper to draw than one `matplotlib.text.Text` per label.
+    The labels are horizontally centered and keep their size (in points)
+    regardless of the data coordinates. Same as text the collection is
+    drawn on top of the segments (zorder 3).
+
+    Args:
+        ax (matplotlib.axes._axes.Axes): The axis the collection will be
+            added to, used to set up the transformations.
+        xy (numpy.ndarray): Array of shape `(n, 2)` with the positions
+            of the labels (data coordinates).
+        s (list): List of length `n` with the labels (str).
+        va (list): List of length `n` with the vertical alignment of each
+            label, either "bottom", "top", or "center".
+        fontsize (None or float): Font size in points, defaults to
+            `matplotlib.rcParams["font.size"]`.
+        color (str): Color of the labels.
+
+    Returns:
+        matplotlib.collections.PathCollection : The collection (not yet added to `ax`).
+    """
+    from matplotlib import rcParams
+    from matplotlib.collections import PathCollection
+    from matplotlib.transforms import IdentityTransform
+
+    if fontsize is None: fontsize = rcParams["font.size"]
+
+    paths = []
+    for label, v in zip(s, va):
+        # Glyphs are cached; labels are set up by shifting the glyphs
+        # by the advance of the preceeding characters (no kerning).
+        verts, codes, x = [], [], 0.
+        for char in label:
+            gv, gc, adv = _get_glyph(char, fontsize)
+            if len(gv) > 0:
+                verts.append(gv + [x, 0.])
+                codes.append(gc)
+            x += adv
+        if len(verts) == 0:
+            paths.append(Path(np.zeros((1, 2))))
+            continue
+        verts = np.concatenate(verts)
+        # Bounding box of the control points; close enough for alignment.
+        y0, y1 = verts[:, 1].min(), verts[:, 1].max()
+        dy     = {"bottom": -y0, "top": -y1}.get(v, -(y0 + y1) / 2.)
+        paths.append(Path(verts + [-x / 2., dy], np.concatenate(codes)))
+
+    # The paths are defined in points; 'sizes = [1]' scales them from points
+    # to pixels (taking the figure dpi into account), the offsets take care
+    # of the positioning in data coordinates.
+    return PathCollection(paths,
+                          sizes            = [1.0],
+                          offsets          = np.asarray(xy, dtype = float),
+                          offset_transform = ax.transData,
+                          transform        = IdentityTransform(),
+                          facecolors       = color,
+                          edgecolors       = "none",
+                          clip_on          = False, # Same as for text
+                          zorder           = 3)
+
+
+@lru_cache(maxsize = 1024)
+def _get_glyph(char, fontsize):
+    """Glyph Path and Advance
+
+    Args:
+        char (str): A single character.
+        fontsize (float): Font size in points (default font family).
+
+    Returns:
+        list : Vertices (`numpy.ndarray`) and codes of the path of the glyph
+        (in points) and the horizontal advance (in points).
+    """
+    from matplotlib.textpath import TextPath
+    from matplotlib.font_manager import FontProperties, findfont, get_font
+
+    font = get_font(findfont(FontProperties()))
+    font.set_size(fontsize, 72)
+    glyph = font.load_char(ord(char))
+    adv   = glyph.linearHoriAdvance / 65536.
+
+    # Whitespace has no outline (only an advance)
+    if char.isspace():
+        return np.zeros((0, 2)), np.zeros(0, dtype = Path.code_type), adv
 
+    path  = TextPath((0, 0), char, size = fontsize)
+    codes = path.codes if path.codes is not None else np.full(len(path.vertices), Path.LINETO)
+    return path.vertices, codes, adv
@@ -0,0 +1,163 @@
+
+import logging
+
+log = logging.getLogger("polarchart")
+
+
+class RenderStats:
+    """Timings and Counters of a Radar Chart
+
+    Opt-in instrumentation for `radar()`. An object of this class can be
+    handed over via the `stats` argument (see `radar()`) and is filled
+    with the wall time spent in each phase (validation, preparation,
+    scaling, layout, geometry, artist creation, drawing), the number of
+    artists and vertices created, and (optionally) the peak memory
+    allocated during the call. When done, a summary is sent to the
+    'polarchart' logger (level `DEBUG`) and the optional callback is called.
+
+    Args:
+        memory (bool): If `True` the peak memory is traced via `tracemalloc`.
+            Defaults to `False` as tracing slows down the allocations.
+        callback (None or callable): If set, called with the `RenderStats`
+            object once the call has finished.
+
+    Examples:
+
+        >>> from polarchart import get_demodata, radar, RenderStats
+        >>> stats = RenderStats(memory = True)
+        >>> radar(get_demodata("gsa"), output = "png", stats = stats)
+        >>> print(stats.phases)
+        >>> print(stats.counters)
+    """
+
+    def __init__(self, memory = False, callback = None):
+        if not isinstance(memory, bool):
+            raise TypeError("argument 'memory' must be bool")
+        if not callback is None and not callable(callback):
+            raise TypeError("argument 'callback' must be None or callable")
+
+        self.memory      = memory
+        self.callback    = callback
+        self.phases      = dict()
+        self.counters    = dict()
+        self.peak_memory = None
+        self._current    = None
+        self._tracing    = False
+
+    def phase(self, name):
+        """Start a Phase
+
+        Ends the current phase (if any) and starts a new one.
+
+        Args:
+            name (str): Name of the phase. If a phase with the same name
+                has been recorded before, the times are summed up.
+        """
+        from time import perf_counter
+        now = perf_counter()
+        if self._current is None and self.memory:
+            import tracemalloc
+            # Do not interfere if someone else is tracing already
+            self._tracing = not tracemalloc.is_tracing()
+            if self._tracing: tracemalloc.start()
+            tracemalloc.reset_peak()
+        elif self._current is not None:
+            self.phases[self._current[0]] = self.phases.get(self._current[0], 0.) + now - self._current[1]
+        self._current = (name, now)
+
+    def count(self, name, n):
+        """Increase a Counter
+
+        Args:
+            name (str): Name of the counter.
+            n (int): Value to add.
+        """
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def stop(self, ax = None):
+        """Finish Recording
+
+        Ends the current phase, counts the artists and vertices on `ax`
+        (if provided), logs the summary and calls the callback.
+
+        Args:
+            ax (None or matplotlib.axes._axes.Axes): Axis to evaluate.
+        """
+        from time import perf_counter
+        if self._current is not None:
+            self.phases[self._current[0]] = self.phases.get(self._current[0], 0.) + perf_counter() - self._current[1]
+            self._current = None
+
+        if self.memory:
+            import tracemalloc
+            if tracemalloc.is_tracing():
+                self.peak_memory = tracemalloc.get_traced_memory()[1]
+                if self._tracing: tracemalloc.stop()
+                self._tracing = False
+
+        if ax is not None:
+            self.count("artists", len(ax.patches) + len(ax.collections) + len(ax.texts))
+            self.count("vertices", sum(len(p.get_xy()) for p in ax.patches) +
+                       sum(sum(len(p.vertices) for p in c.get_paths()) for c in ax.collections))
+
+        log.debug("%s", self)
+        if self.callback is not None: self.callback(self)
+
+    def abort(self):
+        """Abort Recording
+
+        Called if the instrumented call fails; ends the current phase and
+        stops memory tracing (if started by this object). Does not log or
+        call the callback.
+        """
+        self._current = None
+        if self._tracing:
+            import tracemalloc
+            tracemalloc.stop()
+            self._tracing = False
+
+    @property
+    def total(self):
+        """Total wall time (seconds) of all phases"""
+        return sum(self.phases.values())
+
+    def to_dict(self):
+        """Returns the results as a dictionary"""
+        return dict(phases = dict(self.phases), total = self.total,
+                    counters = dict(self.counters),
+                    peak_memory = self.peak_memory)
+
+    def __repr__(self):
+        res = ", ".join(f"{k} {v * 1e3:.1f}ms" for k, v in self.phases.items())
+        res = f"RenderStats(total {self.total * 1e3:.1f}ms; {res}"
+        if len(self.counters) > 0:
+            res += "; " + ", ".join(f"{k} {v}" for k, v in self.counters.items())
+        if self.peak_memory is not None:
+            res += f"; peak memory {self.peak_memory / 2**20:.1f}MiB"
+        return res + ")"
+
+
+class _NullStats:
+    """Used if no RenderStats object is provided; does nothing"""
+
+    def phase(self, name): pass
+    def count(self, name, n): pass
+    def stop(self, ax = None): pass
+    def abort(self): pass
+
+NULL_STATS = _NullStats()
+
+
+def instrumented(fun):
+    """Decorator; aborts the `RenderStats` object handed over via the
+    "stats" argument if `fun` raises (see `RenderStats.abort()`)"""
+    from functools import wraps
+
+    @wraps(fun)
+    def wrapper(*args, **kwargs):
+        try:
+            return fun(*args, **kwargs)
+        except BaseException:
+            if isinstance(kwargs.get("stats"), RenderStats): kwargs["stats"].abort()
+            raise
+    return wrapper
@@ -0,0 +1,248 @@
+
+import numpy as np
+
+
+def radar_stream(source, page_size, labels = True, ncol = None, scale = True,
+                 color = None, numeric_only = False, chunksize = 100_000, **kwargs):
+    """Create Paginated Radar Charts from Data Larger than Memory
+
+    Out-of-core version of `radar_pages()`. Reads the data chunk by chunk
+    in two passes. The first pass collects the number of rows and the
+    minimum and maximum of each column (scaling, circles). The second pass
+    prepares and scales one chunk at a time and yields the pages. At any
+    time only one chunk and one page are held in memory.
+
+    Args:
+        source (str, numpy.ndarray, or callable): The data. Either
+            the path to a file (".csv", ".parquet" (requires `pyarrow`), or
+            ".npy" (memory-mapped)), a two-dimensional `numpy.ndarray`
+            (e.g., a `numpy.memmap`), or a callable returning a new iterator
+            over the chunks (`pandas.DataFrame`s or two-dimensional arrays)
+            on each call (called once per pass).
+        page_size (int): Maximum number of radar charts per page.
+        labels (str, or bool): See `radar()`; applied to each chunk.
+        ncol (None or int): See `radar_pages()`.
+        scale (bool): Should the data be scaled? If `True` the scaling is
+            based on the entire data set.
+        color (None, list): See `radar()`.
+        numeric_only (bool): See `radar()`.
+        chunksize (int): Number of rows read at a time (files and arrays).
+        **kwargs: Forwarded to `radar()` (e.g., "circles", "legend_position",
+            "title", "angle", "figsize").
+
+    Returns:
+        generator : Yields one `matplotlib.figure.Figure` per page.
+
+    Examples:
+
+        >>> from matplotlib.backends.backend_pdf import PdfPages
+        >>> from polarchart import radar_stream
+        >>>
+        >>> with PdfPages("catalog.pdf") as pdf:
+        >>>     for fig in radar_stream("large.csv", page_size = 16,
+        >>>                             labels = "name", numeric_only = True):
+        >>>         pdf.savefig(fig)
+    """
+    from .pages import _check_page_args, _page_figure
+
+    _check_page_args(page_size, labels, ncol, scale, color, numeric_only,
+                     kwargs, "radar_stream")
+    setup, limits = _stream_setup(source, page_size, labels, ncol, scale, color,
+                                  numeric_only, chunksize, kwargs)
+
+    def pages():
+        for page in _stream_pages(source, page_size, labels, numeric_only,
+                                  chunksize, limits):
+            yield _page_figure(page, setup)
+
+    return pages()
+
+
+def export_stream(source, path, page_size, format = "png", processes = 1,
+                  progress = None, labels = True, ncol = None, scale = True,
+                  color = None, numeric_only = False, chunksize = 100_000, **kwargs):
+    """Export Paginated Radar Charts from Data Larger than Memory
+
+    Out-of-core version of `export_pages()`; reads the data in two passes
+    (see `radar_stream()`) and writes one numbered file per page.
+
+    Args:
+        source (str, numpy.ndarray, or callable): The data, see `radar_stream()`.
+        path (str): Output directory, created if it does not exist.
+        page_size (int): Maximum number of radar charts per page.
+        format (str): One of "png" (default), "svg", or "pdf".
+        processes (None or int): Number of worker processes, see
+            `export_pages()`. Defaults to `1` (calling process); each
+            additional process keeps up to two pages in memory.
+        progress (None or callable): If set, called as `progress(done, total)`
+            each time a page has been written.
+        labels (str, or bool): See `radar()`; applied to each chunk.
+        ncol (None or int): See `radar_pages()`.
+        scale (bool): See `radar_stream()`.
+        color (None, list): See `radar()`.
+        numeric_only (bool): See `radar()`.
+        chunksize (int): Number of rows read at a time (files and arrays).
+        **kwargs: Forwarded to `radar()`. Additionally "dpi" and "prefix",
+            see `export_pages()`.
+
+    Returns:
+        list : List of the files written (str), in the order of the pages.
+
+    Examples:
+
+        >>> import numpy as np
+        >>> from polarchart import export_stream
+        >>> x = np.lib.format.open_memmap("large.npy", mode = "w+",
+        >>>                               dtype = float, shape = (100_000, 6))
+        >>> x[:] = np.random.uniform(size = x.shape)
+        >>> files = export_stream("large.npy", "output", page_size = 100)
+    """
+    from .pages import _check_page_args, _check_export_args, _export
+
+    dpi, prefix = _check_export_args(path, format, processes, progress, kwargs)
+    _check_page_args(page_size, labels, ncol, scale, color, numeric_only,
+                     kwargs, "export_stream")
+    setup, limits = _stream_setup(source, page_size, labels, ncol, scale, color,
+                                  numeric_only, chunksize, kwargs)
+
+    pages  = _stream_pages(source, page_size, labels, numeric_only, chunksize, limits)
+    npages = (setup["nrow"] + page_size - 1) // page_size
+    return _export(pages, setup, path, npages, format, dpi, prefix, processes, progress)
+
+
+def _iter_chunks(source, chunksize):
+    """Iterate Over Chunks
+
+    Returns:
+        generator : Yields the chunks as `pandas.DataFrame`s. Rows of arrays
+        are labeled by their (global) row number.
+    """
+    from pandas import DataFrame, RangeIndex, read_csv
+
+    if not isinstance(chunksize, int):
+        raise TypeError("argument 'chunksize' must be int")
+    if chunksize <= 0:
+        raise ValueError("argument 'chunksize' must be a positive integer")
+
+    if callable(source):
+        chunks = source()
+    elif isinstance(source, str) and source.endswith(".csv"):
+        chunks = read_csv(source, chunksize = chunksize)
+    elif isinstance(source, str) and source.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        chunks = (b.to_pandas() for b in pq.ParquetFile(source).iter_batches(batch_size = chunksize))
+    elif isinstance(source, str) and source.endswith(".npy"):
+        chunks = _iter_array(np.load(source, mmap_mode = "r"), chunksize)
+    elif isinstance(source, np.ndarray):
+        chunks = _iter_array(source, chunksize)
+    else:
+        raise TypeError("argument 'source' must be a path (\".csv\", \".parquet\", "
+                        "\".npy\"), a numpy.ndarray, or callable")
+
+    nrow = 0
+    for chunk in chunks:
+        if not isinstance(chunk, DataFrame):
+            chunk = np.asarray(chunk, dtype = float)
+            if not chunk.ndim == 2:
+                raise ValueError("chunks must be two-dimensional")
+            chunk = DataFrame(chunk, index = RangeIndex(nrow, nrow + chunk.shape[0]), copy = False)
+        nrow += chunk.shape[0]
+        yield chunk
+
+
+def _iter_array(x, chunksize):
+    """Chunks of a two-dimensional array (rows; read from disk for memmaps)"""
+    if not x.ndim == 2:
+        raise ValueError("argument 'source' must be two-dimensional")
+    for i in range(0, x.shape[0], chunksize):
+        yield np.asarray(x[i:(i + chunksize)], dtype = float)
+
+
+def _prepare_chunk(chunk, labels, numeric_only, limits = None):
+    """Prepare (and scale) one chunk, see `prepare_num_df()`"""
+    from .utils import prepare_num_df, scale_df
+
+    labels, chunk = prepare_num_df(chunk, labels, numeric_only)
+    chunk = chunk.astype(float)
+    if limits is not None:
+        chunk = scale_df(chunk, copy = False, limits = limits)
+    return labels, chunk
+
+
+def _stream_setup(source, page_size, labels, ncol, scale, color, numeric_only,
+                  chunksize, kwargs):
+    """First Pass
+
+    Collects the number of rows, the columns, and the columnwise minimum
+    and maximum of all chunks.
+
+    Returns:
+        list : Returns a list of length two with the settings for
+        `_page_figure()` (including the total number of rows, 'nrow') and
+        the limits to scale the chunks (`None` if `scale = False`).
+    """
+    from .pages import _page_setup
+
+    columns, nrow, draw_labels = None, 0, labels
+    for chunk in _iter_chunks(source, chunksize):
+        draw_labels, chunk = _prepare_chunk(chunk, labels, numeric_only)
+        if columns is None:
+            columns = chunk.columns
+            mn      = np.full(len(columns), np.inf)
+            mx      = np.full(len(columns), -np.inf)
+        elif not chunk.columns.equals(columns):
+            raise ValueError("all chunks must have the same (numeric) columns")
+        x = chunk.to_numpy(dtype = float, copy = False)
+        np.fmin(mn, np.fmin.reduce(x, axis = 0, initial = np.inf), out = mn)
+        np.fmax(mx, np.fmax.reduce(x, axis = 0, initial = -np.inf), out = mx)
+        nrow += x.shape[0]
+
+    if columns is None:
+        raise ValueError("argument 'source' contains no data")
+
+    # Same as scale_limits(); constant columns are scaled to 0.0
+    limits = None
+    if scale:
+        rng    = mx - mn
+        rng[~(rng > 0)] = np.inf
+        limits = [mn, rng]
+        xmax   = 1
+    else:
+        xmax   = float(np.max(mx))
+
+    setup = _page_setup((nrow, len(columns)), page_size, draw_labels, ncol,
+                        color, xmax, kwargs)
+    setup["nrow"] = nrow
+    return setup, limits
+
+
+def _stream_pages(source, page_size, labels, numeric_only, chunksize, limits):
+    """Second Pass
+
+    Reads, prepares, and scales the chunks and splits them into pages.
+    Pages spanning two chunks are combined such that only one chunk
+    and one page are held in memory.
+
+    Returns:
+        generator : Yields the data (pandas.DataFrame) of each page.
+    """
+    from pandas import concat
+
+    rest = None # Incomplete page from the previous chunk
+    for chunk in _iter_chunks(source, chunksize):
+        _, chunk = _prepare_chunk(chunk, labels, numeric_only, limits)
+        i = 0
+        if rest is not None:
+            i    = page_size - rest.shape[0]
+            rest = concat([rest, chunk.iloc[:i]])
+            if rest.shape[0] < page_size: continue
+            yield rest
+            rest = None
+        for i in range(i, chunk.shape[0], page_size):
+            page = chunk.iloc[i:(i + page_size)]
+            if page.shape[0] < page_size:
+                rest = page.copy() # Do not keep the chunk alive
+            else:
+                yield page
+    if rest is not None and rest.shape[0] > 0:
+        yield rest
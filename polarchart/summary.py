@@ -0,0 +1,300 @@
+
+import numpy as np
+
+
+def radar_summary(df, groups = 8, by = None, envelope = ((0., 1.), (0.25, 0.75)),
+                  scale = True, numeric_only = False, bins = 256, seed = None,
+                  **kwargs):
+    """Aggregated Radar Charts
+
+    Overview of large data sets. Instead of one radar chart per row the
+    rows are grouped and one radar chart is drawn per group, showing the
+    median of each variable (segments) and translucent envelopes (e.g.,
+    minimum to maximum, and the interquartile range). The rows are either
+    grouped by a mini-batch k-means clustering of the (scaled) values or
+    by a grouping column (see `by`).
+
+    The statistics are calculated chunk by chunk from histograms
+    (`bins` bins per group and variable) wherefore the run time is linear
+    in the number of rows and the additional memory is bounded. Medians
+    and quantiles are approximated to `1 / bins` of the range of each variable,
+    minima and maxima are exact.
+
+    Args:
+        df (pandas.core.frame.DataFrame): A pandas DataFrame with numeric values,
+            see `radar()`.
+        groups (int): Number of clusters (if `by = None`) or number of groups
+            for a numeric grouping column (quantiles).
+        by (None or str): If `None` (default) the rows are clustered. Else
+            the name of the column used to group the rows; numeric
+            columns are split into `groups` groups of (roughly) equal size
+            (quantiles), for non-numeric columns one group per unique value
+            is used.
+        envelope (list or tuple): Sequence of tuples `(lower, upper)` with the
+            probabilities of the quantiles defining the envelopes; '0' and '1'
+            correspond to the minimum and maximum (default: minimum to maximum
+            and the interquartile range). An empty list draws the medians only.
+        scale (bool): Should the data be scaled? See `radar()`.
+        numeric_only (bool): See `radar()`.
+        bins (int): Number of histogram bins used to approximate the quantiles.
+        seed (None or int): Seed for the clustering.
+        **kwargs: Forwarded to `radar()` (e.g., "ax", "output", "ncol",
+            "color", "circles", "legend_position", "title", "angle", "figsize").
+
+    Returns:
+        See `radar()`.
+
+    Examples:
+
+        >>> import numpy as np
+        >>> import pandas as pd
+        >>> from polarchart import radar_summary
+        >>> x = pd.DataFrame(np.random.gamma(2., 2., size = (1_000_000, 6)),
+        >>>                  columns = list("ABCDEF"))
+        >>> radar_summary(x, groups = 6, title = "Clustered overview")
+    """
+
+    from pandas import DataFrame
+    from pandas.api.types import is_numeric_dtype
+    from matplotlib.collections import PolyCollection
+    from .radar import radar
+    from .utils import prepare_num_df, scale_limits
+
+    # -----------------------------------------------------------------
+    # Sanity checks, remaining arguments are checked by radar()
+    # -----------------------------------------------------------------
+    if not isinstance(df, DataFrame):
+        raise TypeError("argument 'df' must be a pandas.DataFrame")
+    if not isinstance(groups, int) or isinstance(groups, bool):
+        raise TypeError("argument 'groups' must be int")
+    if groups <= 0:
+        raise ValueError("argument 'groups' must be a positive integer")
+    if not isinstance(by, (type(None), str)):
+        raise TypeError("argument 'by' must be None or str")
+    if by is not None and not by in df.columns:
+        raise ValueError(f"column '{by}' not found in 'df'")
+    if not isinstance(envelope, (list, tuple)) or \
+       not all([isinstance(e, tuple) and len(e) == 2 for e in envelope]):
+        raise TypeError("argument 'envelope' must be a list of tuples of length 2")
+    if not all([0 <= e[0] <= e[1] <= 1 for e in envelope]):
+        raise ValueError("probabilities in 'envelope' must be within [0, 1] (lower <= upper)")
+    if not isinstance(scale, bool):
+        raise TypeError("argument 'scale' must be boolean True (default) or False")
+    if not isinstance(bins, int) or bins < 2:
+        raise ValueError("argument 'bins' must be an integer larger than 1")
+    if "dpi" in kwargs:
+        if not isinstance(kwargs["dpi"], int) or isinstance(kwargs["dpi"], bool):
+            raise TypeError("**kwarg 'dpi' must be int")
+        if kwargs["dpi"] <= 0:
+            raise ValueError("**kwarg 'dpi' must be positive")
+    for k in ["labels", "handle", "virtual", "xmax"]:
+        if k in kwargs:
+            raise ValueError(f"argument '{k}' not allowed in radar_summary()")
+
+    # -----------------------------------------------------------------
+    # Grouping
+    # -----------------------------------------------------------------
+    _, x = prepare_num_df(df if by is None else df.drop(columns = by), False, numeric_only)
+    columns = x.columns
+    x       = x.to_numpy(dtype = float, copy = False)
+    if x.shape[0] == 0:
+        raise ValueError("argument 'df' contains no data")
+    limits  = scale_limits(x)
+
+    if by is None:
+        centers = _minibatch_kmeans(x, groups, limits, seed = seed)
+        group   = _assign(x, centers, limits)
+        names   = [f"cluster {i + 1}" for i in range(len(centers))]
+    elif is_numeric_dtype(df[by]):
+        v     = df[by].to_numpy(dtype = float)
+        ok    = ~np.isnan(v)
+        edges = np.unique(np.quantile(v[ok], np.linspace(0, 1, groups + 1))) if ok.any() \
+                else np.zeros(0)
+        # Constant column: one group
+        if edges.size == 1: edges = np.repeat(edges, 2)
+        group = np.searchsorted(edges[1:-1], v, side = "right")
+        group[np.isnan(v)] = -1 # Excluded
+        names = [f"{by} [{edges[i]:.3g}, {edges[i + 1]:.3g}{']' if i == len(edges) - 2 else ')'}"
+                 for i in range(len(edges) - 1)]
+    else:
+        from pandas import factorize
+        group, names = factorize(df[by])
+        names = [str(n) for n in names]
+
+    # -----------------------------------------------------------------
+    # Statistics per group and variable
+    # -----------------------------------------------------------------
+    stats = _group_quantiles(x, group, len(names), limits, bins,
+                             probs = [0.5] + [p for e in envelope for p in e])
+    n     = np.bincount(group[group >= 0], minlength = len(names))
+    keep  = n > 0
+    if not keep.any():
+        raise ValueError(f"no rows left after grouping (missing values in '{by}')")
+    stats = stats[:, keep, :]
+    names = [f"{names[i]} ({n[i]})" for i in np.flatnonzero(keep)]
+
+    # Scaled values ([0, 1]) back to the original scale if needed
+    if not scale:
+        rng   = np.where(np.isinf(limits[1]), 0., limits[1])
+        stats = stats * rng + limits[0]
+        xmax  = float(np.nanmax(stats))
+    else:
+        xmax  = 1
+
+    # -----------------------------------------------------------------
+    # Plotting; medians via radar(), envelopes on top
+    # -----------------------------------------------------------------
+    output = kwargs.pop("output", None)
+    ax     = kwargs.pop("ax", None)
+    if ax is None:
+        figsize = kwargs.pop("figsize", (6, 6))
+        if output is None:
+            import matplotlib.pyplot as plt
+            ax = plt.subplots(figsize = figsize)[1]
+        else:
+            from matplotlib.figure import Figure
+            ax = Figure(figsize = figsize).subplots()
+        show = output is None
+    else:
+        show = False
+    dpi = kwargs.pop("dpi", 100)
+
+    handle = radar(DataFrame(stats[0], index = names, columns = columns),
+                   ax = ax, scale = False, xmax = xmax, handle = True, **kwargs)
+
+    color = handle.collection.get_facecolors()[:len(columns)]
+    for i in range(len(envelope)):
+        lo, hi = stats[1 + 2 * i], stats[2 + 2 * i]
+        band   = _band_verts(handle, lo, hi)
+        fc     = color.copy()
+        fc[:, 3] = 0.25
+        ax.add_collection(PolyCollection(band, closed = True,
+                                         facecolors = np.tile(fc, (lo.shape[0], 1)),
+                                         edgecolors = "none"),
+                          autolim = False)
+
+    if output == "figure":
+        return ax.figure
+    elif output is not None:
+        from io import BytesIO
+        buf = BytesIO()
+        ax.figure.savefig(buf, format = output, dpi = dpi)
+        return buf.getvalue()
+    elif show:
+        import matplotlib.pyplot as plt
+        plt.show()
+    else:
+        return ax
+
+
+def _minibatch_kmeans(x, k, limits, batch_size = 1024, iterations = 100, seed = None):
+    """Mini-Batch K-Means
+
+    Clusters the (scaled) rows of `x`, see Sculley (2010), Web-Scale K-Means
+    Clustering. Missing values are set to '0.5' (middle of the scaled range).
+    The run time is independent of the number of rows.
+
+    Returns:
+        numpy.ndarray : Array of shape `(k, ncol)` with the cluster centers
+        (scaled; fewer than `k` if `x` has less than `k` rows).
+    """
+    rng = np.random.default_rng(seed)
+    n   = x.shape[0]
+    get = lambda i: np.nan_to_num((x[i] - limits[0]) / limits[1], nan = 0.5)
+
+    # k-means++ initialization on a subsample
+    sample  = get(rng.choice(n, size = min(n, 100 * k), replace = False))
+    centers = [sample[rng.integers(len(sample))]]
+    for i in range(1, min(k, len(sample))):
+        d = ((sample[:, None, :] - np.asarray(centers)[None, :, :])**2).sum(axis = -1).min(axis = 1)
+        if not d.sum() > 0: break
+        centers.append(sample[rng.choice(len(sample), p = d / d.sum())])
+    centers = np.asarray(centers)
+
+    # Mini-batch updates; per-center learning rate 1 / count
+    counts = np.zeros(len(centers))
+    for it in range(iterations):
+        batch = get(rng.integers(n, size = min(n, batch_size)))
+        g     = ((batch[:, None, :] - centers[None, :, :])**2).sum(axis = -1).argmin(axis = 1)
+        m     = np.bincount(g, minlength = len(centers))
+        sums  = np.zeros_like(centers)
+        np.add.at(sums, g, batch)
+        counts  += m
+        hit      = m > 0
+        centers[hit] += (sums[hit] - m[hit, None] * centers[hit]) / counts[hit, None]
+    return centers
+
+
+def _assign(x, centers, limits, chunksize = 65536):
+    """Nearest cluster center for each row of `x` (chunk by chunk)"""
+    group = np.empty(x.shape[0], dtype = int)
+    for i in range(0, x.shape[0], chunksize):
+        chunk = np.nan_to_num((x[i:(i + chunksize)] - limits[0]) / limits[1], nan = 0.5)
+        group[i:(i + chunksize)] = ((chunk[:, None, :] - centers[None, :, :])**2).sum(axis = -1).argmin(axis = 1)
+    return group
+
+
+def _group_quantiles(x, group, ngroups, limits, bins, probs, chunksize = 65536):
+    """Quantiles per Group and Variable
+
+    Fills one histogram per group and variable (on the scaled values) chunk
+    by chunk and derives the quantiles by linear interpolation within the bins.
+    Probabilities '0' and '1' return the exact minimum and maximum.
+    Rows with a negative group are ignored.
+
+    Returns:
+        numpy.ndarray : Array of shape `(len(probs), ngroups, ncol)`, scaled
+        values (missing if a group has no (non-missing) values).
+    """
+    k      = x.shape[1]
+    counts = np.zeros(ngroups * k * bins, dtype = np.int64)
+    gmin   = np.full((ngroups, k), np.inf)
+    gmax   = np.full((ngroups, k), -np.inf)
+    for i in range(0, x.shape[0], chunksize):
+        g     = group[i:(i + chunksize)]
+        chunk = (x[i:(i + chunksize)] - limits[0]) / limits[1]
+        chunk, g = chunk[g >= 0], g[g >= 0]
+        np.fmin.at(gmin, g, chunk)
+        np.fmax.at(gmax, g, chunk)
+        b     = np.clip(np.nan_to_num(chunk * bins), 0, bins - 1).astype(np.int64)
+        flat  = (g[:, None] * k + np.arange(k)[None, :]) * bins + b
+        counts += np.bincount(flat[~np.isnan(chunk)], minlength = counts.size)
+
+    counts = counts.reshape(ngroups, k, bins)
+    cum    = np.cumsum(counts, axis = -1)
+    total  = cum[:, :, -1]
+    res    = np.full((len(probs), ngroups, k), np.nan)
+    for j, p in enumerate(probs):
+        if p == 0:   res[j] = gmin
+        elif p == 1: res[j] = gmax
+        else:
+            target = p * total
+            b      = (cum < target[:, :, None]).sum(axis = -1).clip(0, bins - 1)
+            below  = np.take_along_axis(cum, b[:, :, None], axis = -1)[:, :, 0] - \
+                     np.take_along_axis(counts, b[:, :, None], axis = -1)[:, :, 0]
+            inbin  = np.take_along_axis(counts, b[:, :, None], axis = -1)[:, :, 0]
+            frac   = np.divide(target - below, inbin, out = np.zeros(target.shape), where = inbin > 0)
+            res[j] = np.clip((b + frac) / bins, gmin, gmax)
+        res[j][total == 0] = np.nan
+    return res
+
+
+def _band_verts(handle, lower, upper):
+    """Vertices of the Envelopes
+
+    Annular sectors between `lower` and `upper` for each segment of each
+    radar chart, based on the geometry of the radar charts (`RadarHandle`).
+
+    Returns:
+        numpy.ndarray : Array of shape `(n * k, 2 * npts, 2)`.
+    """
+    from .geometry import calc_radar_verts
+
+    arcs = [calc_radar_verts(v, handle.centers,
+                             radius = handle.radius,
+                             xmax   = handle.xmax,
+                             angle  = handle.angle,
+                             step   = handle.step)[0].reshape(v.size, -1, 2)[:, 1:, :]
+            for v in [lower, upper]]
+    # Outer arc followed by the inner one (reversed)
+    return np.concatenate([arcs[1], arcs[0][:, ::-1, :]], axis = 1)
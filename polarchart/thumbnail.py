@@ -0,0 +1,179 @@
+
+import numpy as np
+
+
+def radar_thumbnails(df, size = 64, scale = True, color = None, numeric_only = False,
+                     supersample = 4, background = "white", angle = 0, radius = 0.45):
+    """Radar Chart Thumbnails as Arrays
+
+    Lightweight alternative to `radar()` for large numbers of small previews
+    (e.g., sparklines in a table). Does not use matplotlib figures or
+    renderers; the segments (see `geometry.calc_radar_verts()`) are
+    scanline-filled straight into an RGBA array, one image per row of
+    `df`. Antialiasing by supersampling. Only the segments are drawn
+    (no circles, edges, or text).
+
+    Args:
+        df (pandas.core.frame.DataFrame or numpy.ndarray): A pandas DataFrame
+            with numeric values (see `radar()`; the index is not used)
+            or a two-dimensional numeric array, one thumbnail per row.
+        size (int or tuple): Size of the thumbnails in pixels, either
+            an integer (square) or a tuple `(width, height)`.
+        scale (bool): Should the data be scaled? See `radar()`.
+        color (None, list): Colors of the segments (any matplotlib color).
+            If `None` `colorspace.qualitative_hcl("Dynamic")` is used
+            as in `radar()`.
+        numeric_only (bool): See `radar()`.
+        supersample (int): Number of samples per pixel in each direction
+            (antialiasing), `1` disables antialiasing.
+        background (None, str, or tuple): Background color; `None` for a
+            transparent background.
+        angle (float or int): Rotation angle in degrees, see `radar()`.
+        radius (float): Maximum radius of the segments as a fraction of the
+            thumbnail size (smaller side).
+
+    Returns:
+        numpy.ndarray : Array of type `uint8` and shape `(n, height, width, 4)`
+        (RGBA).
+
+    Examples:
+
+        >>> from polarchart import get_demodata, radar_thumbnails
+        >>> from PIL import Image
+        >>> gsa = get_demodata("gsa")
+        >>> img = radar_thumbnails(gsa, size = 64)
+        >>> Image.fromarray(img[0]).save("thumb.png")
+    """
+    from pandas import DataFrame
+    from matplotlib.colors import to_rgba, to_rgba_array
+    from .geometry import calc_radar_verts, calc_arc_step
+    from .utils import prepare_num_df, scale_df
+
+    if isinstance(size, int): size = (size, size)
+    if not isinstance(size, tuple) or not len(size) == 2 or \
+       not all([isinstance(x, int) and x > 0 for x in size]):
+        raise ValueError("argument 'size' must be a positive int or a tuple of two")
+    if not isinstance(scale, bool):
+        raise TypeError("argument 'scale' must be boolean True (default) or False")
+    if not isinstance(color, (type(None), list)):
+        raise TypeError("argument 'color' must be None or list")
+    if not isinstance(supersample, int) or supersample < 1:
+        raise ValueError("argument 'supersample' must be a positive integer")
+    if not isinstance(angle, (int, float)):
+        raise TypeError("argument 'angle' must be float or int")
+    if not isinstance(radius, float) or not 0 < radius <= 0.5:
+        raise ValueError("argument 'radius' must be a float in (0, 0.5]")
+
+    if isinstance(df, DataFrame):
+        _, df = prepare_num_df(df, False, numeric_only)
+    values = np.array(df, dtype = float) # Copy, scaled in-place below
+    if not values.ndim == 2:
+        raise ValueError("argument 'df' must be a pandas.DataFrame or a two-dimensional array")
+    if scale:
+        values = scale_df(values, copy = False)
+        xmax   = 1.
+    else:
+        # Maximum ignoring missing values; if not positive (e.g., all zero
+        # or missing) the thumbnails stay empty.
+        xmax   = float(np.fmax.reduce(values.ravel(), initial = -np.inf))
+        if not xmax > 0: xmax = 1.
+    # Missing values (and negative values) are not drawn
+    values = np.clip(np.nan_to_num(values, nan = 0.), 0, None)
+
+    n, k = values.shape
+    if color is None:
+        from colorspace import qualitative_hcl
+        color = qualitative_hcl("Dynamic")(k)
+    if len(color) < k:
+        raise ValueError("argument 'color' must contain (at least) one color per column")
+
+    # Colors (premultiplied alpha)
+    bg   = np.zeros(4) if background is None else np.array(to_rgba(background))
+    cols = to_rgba_array(color[:k])
+    cols[:, :3] *= cols[:, 3:]
+    bg[:3] *= bg[3]
+
+    # Arcs with a precision of a quarter pixel; y downwards as in radar()
+    r      = radius * min(size)
+    step   = calc_arc_step(r, 0.25)
+    center = np.array([[size[0] / 2, size[1] / 2]])
+
+    res = np.empty((n, size[1], size[0], 4), dtype = np.uint8)
+    # Batches of thumbnails; limits the size of the temporary arrays
+    nb  = max(1, 2**20 // (size[0] * size[1] * supersample))
+    for i in range(0, n, nb):
+        x = values[i:(i + nb)]
+        verts, _ = calc_radar_verts(x, np.repeat(center, x.shape[0], axis = 0),
+                                    radius = r, xmax = xmax, angle = angle, step = step)
+        img = _fill_polygons(verts.reshape(x.shape[0] * k, -1, 2), np.tile(cols, (x.shape[0], 1)),
+                             x.shape[0], size, supersample)
+        # Segments over background (channels first); un-premultiplying
+        # alpha is only needed if the background is not opaque.
+        alpha = 1 - img[3]
+        for c in range(4): img[c] += alpha * bg[c]
+        if bg[3] < 1:
+            np.divide(img[:3], img[3], out = img[:3], where = img[3] > 0)
+        img = np.clip(img, 0, 1, out = img) * 255 + 0.5
+        res[i:(i + nb)] = np.moveaxis(img, 0, -1)
+
+    return res
+
+
+def _fill_polygons(verts, color, n, size, supersample):
+    """Scanline Fill with Antialiasing
+
+    Rasterizes simple, non-overlapping polygons into `n` images. Each pixel
+    row is sampled along `supersample` scanlines; along the scanlines the
+    exact coverage of the pixels is calculated.
+
+    Args:
+        verts (numpy.ndarray): Array of shape `(n * m, v, 2)` with the vertices
+            of `m` polygons per image (closed implicitly) in pixel coordinates.
+        color (numpy.ndarray): Array of shape `(n * m, 4)` with the (premultiplied)
+            colors of the polygons.
+        n (int): Number of images.
+        size (tuple): Width and height of the images.
+        supersample (int): Number of scanlines per pixel row.
+
+    Returns:
+        numpy.ndarray : Array of shape `(4, n, height, width)` with the
+        coverage-weighted colors (channels first).
+    """
+    w, h = size
+    s    = supersample
+    npol, v = verts.shape[:2]
+    m    = npol // n
+
+    # Edges; orientation of the polygons (sign of the area) such that
+    # an edge going up or down opens or closes a span (winding number).
+    x0, y0 = verts[..., 0], verts[..., 1]
+    x1, y1 = np.roll(x0, -1, axis = 1), np.roll(y0, -1, axis = 1)
+    orient = np.sign(np.sum(x0 * y1 - x1 * y0, axis = 1))
+    x0, y0, x1, y1 = x0.ravel(), y0.ravel(), x1.ravel(), y1.ravel()
+    sign   = np.where(y1 > y0, -1., 1.) * np.repeat(orient, v)
+
+    # Scanlines y = (j + 0.5) / s crossed by each edge (half-open such
+    # that vertices are counted once, horizontal edges never).
+    j0  = np.clip(np.ceil(np.minimum(y0, y1) * s - 0.5), 0, h * s).astype(int)
+    j1  = np.clip(np.ceil(np.maximum(y0, y1) * s - 0.5), 0, h * s).astype(int)
+    cnt = j1 - j0
+    e   = np.repeat(np.arange(x0.size), cnt)
+    j   = np.arange(e.size) - np.repeat(np.cumsum(cnt) - cnt - j0, cnt)
+    y   = (j + 0.5) / s
+    x   = np.clip(x0[e] + (y - y0[e]) * (x1[e] - x0[e]) / (y1[e] - y0[e]), 0, w)
+
+    # Each crossing adds a (signed) step to its scanline: 1 - f to the
+    # pixel i = floor(x) and f to i + 1 (f = x - i), as differences
+    # cumulated along the rows. The scanlines of a pixel row are summed
+    # up before cumulating (linear).
+    i   = np.floor(x)
+    f   = x - i
+    row = ((e // v // m) * h + j // s) * (w + 2)
+    idx = np.concatenate([i, i + 1]).astype(int) + np.tile(row, 2)
+    wt  = np.concatenate([1 - f, f]) * np.tile(sign[e], 2) / s
+    col = np.tile(color[e // v], (2, 1))
+
+    diff = np.empty((4, n, h, w + 2))
+    for c in range(4):
+        diff[c] = np.bincount(idx, wt * col[:, c], minlength = n * h * (w + 2)).reshape(n, h, w + 2)
+    return np.cumsum(diff, axis = 3)[..., :w]
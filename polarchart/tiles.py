@@ -0,0 +1,181 @@
+
+import numpy as np
+
+
+class TileRenderer:
+    """Render Blocks of a Radar Grid as Tiles
+
+    Prepares and scales the data once and fixes the layout of the grid
+    (see `utils.get_gridsize()`). Any rectangular block of cells can then
+    be rendered into a PNG image of fixed size (a tile), e.g., to be served
+    to a (web) map viewer. Only the radar charts inside the block are drawn
+    (see `VirtualGrid`). Optionally, the tiles are stored in a size-bounded
+    disk cache (`cache.DiskCache`) keyed by a hash of the data, the style,
+    the matplotlib version and settings (see `cache.render_key()`), and
+    the block; repeated requests are served from the cache.
+
+    Args:
+        df (pandas.core.frame.DataFrame): A pandas DataFrame with numeric values,
+            see `radar()`.
+        labels (str, or bool): See `radar()`.
+        ncol (None or int): Number of columns of the grid. If `None` the
+            grid is calculated based on the figure size ("figsize", see
+            **kwargs) as in `radar()`.
+        scale (bool): Should the data be scaled? See `radar()`.
+        color (None, list): See `radar()`.
+        numeric_only (bool): See `radar()`.
+        tile_size (int or tuple): Size of the tiles in pixels, either
+            an integer (square tiles) or a tuple `(width, height)`.
+        cache (None, str, or DiskCache): If `None` (default) tiles are not
+            cached. If str, a `DiskCache` is set up in this directory.
+        **kwargs: Additional arguments: "figsize" (used to calculate the grid),
+            "dpi" (resolution of the tiles, defaults to 100; scales the labels),
+            "angle", "circles", "ring_labels" (bool), and "fast_labels"
+            (defaults to `True`), see `radar()`.
+
+    Examples:
+
+        >>> from polarchart import get_demodata, TileRenderer
+        >>> tiles = TileRenderer(get_demodata("gsa"), cache = "tile_cache")
+        >>> print(tiles.layout)
+        >>> png = tiles.render(0, 0, 2, 2) # Columns 0-1, rows 0-1
+        >>> png = tiles.tile(0, 0, cells = 2) # Same tile
+    """
+
+    def __init__(self, df, labels = True, ncol = None, scale = True, color = None,
+                 numeric_only = False, tile_size = 256, cache = None, **kwargs):
+        from pandas import DataFrame
+        from matplotlib.figure import Figure
+        from .utils import prepare_num_df, scale_df, pretty_ticks, axis_get_size, get_gridsize
+        from .cache import DiskCache, render_key
+
+        if not isinstance(df, DataFrame):
+            raise TypeError("argument 'df' must be a pandas.DataFrame")
+        if not isinstance(ncol, (type(None), int)):
+            raise TypeError("argument 'ncol' must be None or int")
+        if not isinstance(scale, bool):
+            raise TypeError("argument 'scale' must be boolean True (default) or False")
+        if not isinstance(color, (type(None), list)):
+            raise TypeError("argument 'color' must be None or list")
+        if isinstance(tile_size, int): tile_size = (tile_size, tile_size)
+        if not isinstance(tile_size, tuple) or not len(tile_size) == 2 or \
+           not all([isinstance(x, int) and x > 0 for x in tile_size]):
+            raise ValueError("argument 'tile_size' must be a positive int or a tuple of two")
+        if isinstance(cache, str): cache = DiskCache(cache)
+        if not isinstance(cache, (type(None), DiskCache)):
+            raise TypeError("argument 'cache' must be None, str, or DiskCache")
+
+        style = dict(figsize = (6, 6), dpi = 100, angle = 0, circles = True,
+                     ring_labels = True, fast_labels = True)
+        for k, v in kwargs.items():
+            if not k in style:
+                raise ValueError(f"**kwarg '{k}' not allowed in TileRenderer()")
+            style[k] = v
+
+        # Preparing the data once (see radar())
+        labels, df = prepare_num_df(df.copy(deep = False), labels, numeric_only)
+        df   = df.astype(float)
+        if scale:
+            df   = scale_df(df, copy = False)
+            xmax = 1
+        else:
+            xmax = float(df.max().max())
+        if color is None:
+            from colorspace import qualitative_hcl
+            color = qualitative_hcl("Dynamic")(df.shape[1])
+
+        # Layout of the entire grid
+        if ncol is None:
+            ax = Figure(figsize = style["figsize"]).subplots()
+            _, ncol = get_gridsize(axis_get_size(ax), None, n = df.shape[0])
+        idx = np.arange(df.shape[0])
+
+        self.layout    = ((df.shape[0] + ncol - 1) // ncol, ncol)
+        self.tile_size = tile_size
+        self.style     = style
+        self.cache     = cache
+        self.values    = df.to_numpy()
+        self.centers   = np.column_stack([idx % ncol, idx // ncol])
+        self.names     = [str(x) for x in df.index] if labels else None
+        self.color     = color
+        self.xmax      = xmax
+        self.at        = pretty_ticks(xmax, 4) if style["circles"] else None
+        # Includes the layout, the matplotlib version and settings (persistent cache)
+        self.key       = render_key(df, ncol, labels, tile_size, color, xmax, sorted(style.items()))
+
+    def render(self, col0, row0, col1, row1):
+        """Render a Block of Cells
+
+        Args:
+            col0 (int): First column of the block.
+            row0 (int): First row of the block.
+            col1 (int): Last column of the block (exclusive).
+            row1 (int): Last row of the block (exclusive).
+
+        Returns:
+            bytes : The tile (PNG). Cells outside the grid stay empty.
+        """
+        from io import BytesIO
+        from matplotlib.figure import Figure
+        from .virtual import VirtualGrid
+
+        block = (col0, row0, col1, row1)
+        if not all([isinstance(x, int) for x in block]):
+            raise TypeError("arguments 'col0', 'row0', 'col1', 'row1' must be int")
+        if not (col1 > col0 and row1 > row0):
+            raise ValueError("empty block ('col1' must be larger than 'col0', 'row1' larger than 'row0')")
+
+        if self.cache is not None:
+            key = f"{self.key}_{col0}_{row0}_{col1}_{row1}"
+            res = self.cache.get(key)
+            if res is not None: return res
+
+        dpi = self.style["dpi"]
+        fig = Figure(figsize = (self.tile_size[0] / dpi, self.tile_size[1] / dpi), dpi = dpi)
+        ax  = fig.add_axes([0, 0, 1, 1])
+        ax.set_axis_off()
+        # Limits (aspect ratio 1:1) such that the block is centered
+        # in the tile; y-axis inverted (top down).
+        w, h = self.tile_size
+        upp  = max((col1 - col0) / w, (row1 - row0) / h) # Units per pixel
+        cx, cy = (col0 + col1 - 1) / 2, (row0 + row1 - 1) / 2
+        ax.set_xlim(cx - upp * w / 2, cx + upp * w / 2)
+        ax.set_ylim(cy + upp * h / 2, cy - upp * h / 2)
+
+        # A margin of (at least) one cell such that labels of neighboring
+        # cells reaching into the block are drawn as well.
+        VirtualGrid(ax, self.values, self.centers,
+                    names       = self.names,
+                    color       = self.color,
+                    radius      = 0.4,
+                    xmax        = self.xmax,
+                    angle       = self.style["angle"],
+                    step        = 2 * np.pi / 180,
+                    at          = self.at,
+                    ring_labels = self.style["ring_labels"],
+                    fast_labels = self.style["fast_labels"],
+                    margin      = 1 / max(col1 - col0, row1 - row0))
+
+        buf = BytesIO()
+        fig.savefig(buf, format = "png", dpi = dpi)
+        res = buf.getvalue()
+        if self.cache is not None: self.cache.put(key, res)
+        return res
+
+    def tile(self, x, y, cells = 4):
+        """Render a Tile of a Regular Tiling
+
+        Args:
+            x (int): Tile index along the columns.
+            y (int): Tile index along the rows.
+            cells (int): Number of cells per tile (in both directions).
+
+        Returns:
+            bytes : The tile (PNG), see `render()`.
+        """
+        if not all([isinstance(v, int) for v in [x, y, cells]]):
+            raise TypeError("arguments 'x', 'y', and 'cells' must be int")
+        return self.render(x * cells, y * cells, (x + 1) * cells, (y + 1) * cells)
+
+    def __repr__(self):
+        return f"TileRenderer({self.values.shape[0]} charts, grid {self.layout[0]} x {self.layout[1]})"
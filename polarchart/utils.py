@@ -3,28 +3,133 @@
 import numpy as np
 
 
-def scale_df(df):
-    """scale_df(df)
+def scale_limits(df):
+    """scale_limits(df)
+
+    Columnwise limits used by `scale_df()`.
+
+    Args:
+        df : pandas.DataFrame or numpy.ndarray
+            An all numeric (!) pandas DataFarame or a two-dimensional
+            numpy array.
+
+    Returns:
+        list : Returns a list of length two with the minimum and the range
+        (maximum minus minimum) of each column (numpy.ndarray). Missing
+        values are ignored. The range of constant (and all-missing) columns
+        is set to infinity such that the scaled values are '0.0'.
+    """
+    from pandas import DataFrame
+
+    x = df.to_numpy(dtype = float, copy = False) if isinstance(df, DataFrame) else np.asarray(df, dtype = float)
+    if not x.ndim == 2:
+        raise ValueError("argument 'df' must be two-dimensional")
+
+    # fmin/fmax ignore missing values
+    mn  = np.fmin.reduce(x, axis = 0, initial = np.inf)
+    rng = np.fmax.reduce(x, axis = 0, initial = -np.inf) - mn
+    rng[~(rng > 0)] = np.inf
+    return mn, rng
+
+
+def scale_df(df, copy = True, limits = None):
+    """scale_df(df, copy = True, limits = None)
 
     Args:
-        df : pandas.DataFrame
-            An all numeric (!) pandas DataFarame.
+        df : pandas.DataFrame or numpy.ndarray
+            An all numeric (!) pandas DataFarame or a two-dimensional
+            numpy array.
+        copy : bool
+            If `True` (default) a new object is returned. If `False` the
+            values are scaled in-place if the underlying (float) array
+            is writeable, avoiding any additional copy of the data (e.g.,
+            float numpy arrays; not DataFrames under copy-on-write, where
+            the values are read-only).
+        limits : None or list
+            If `None` (default) the limits are calculated from `df`. Else
+            a list of length two with the minimum and the range per column
+            as returned by `scale_limits()`, e.g., to scale new data the
+            same way as a previous data set.
 
     Returns:
-        pandas.DataFrame : Returns an object of the same dimension as the
-        input argument 'df' scaled rowwise. I.e., the highest value per row
-        is scaled to '1.0', the lowest to '0.0'.
+        pandas.DataFrame or numpy.ndarray : Returns an object of the same
+        dimension and type as the input argument 'df' scaled columnwise.
+        I.e., the highest value per column is scaled to '1.0', the lowest
+        to '0.0'. Missing values are ignored when searching for the
+        minimum and maximum and stay missing. Columns with a range of zero
+        (constant values) are set to '0.0'.
     """
+    from pandas import DataFrame
+
+    if not isinstance(copy, bool):
+        raise TypeError("argument 'copy' must be bool")
+    if not isinstance(limits, (type(None), list, tuple)):
+        raise TypeError("argument 'limits' must be None or a list")
 
-    def fn(x):
-        mn = np.min(x)
-        mx = np.max(x)
-        return (x - mn) / (mx - mn)
+    isdf = isinstance(df, DataFrame)
+    x    = df.to_numpy(dtype = float, copy = False) if isdf else np.asarray(df, dtype = float)
+    if not x.ndim == 2:
+        raise ValueError("argument 'df' must be two-dimensional")
 
-    for j in range(df.shape[1]):
-        df.iloc[:, j] = fn(df.iloc[:, j])
+    # Constant columns (and all-missing columns) are divided by infinity,
+    # resulting in 0.0 (missing values stay missing).
+    mn, rng = scale_limits(x) if limits is None else limits
+    if not len(mn) == len(rng) == x.shape[1]:
+        raise ValueError("length of 'limits' does not match the number of columns")
 
-    return df
+    # Scaling the data in-place if possible; else a new array is allocated
+    # once (but no temporary arrays).
+    out = x if not copy and x.flags.writeable else None
+    out = np.subtract(x, mn, out = out)
+    np.divide(out, rng, out = out)
+
+    if isdf:
+        return DataFrame(out, index = df.index, columns = df.columns, copy = False)
+    return out
+
+
+def axis_get_size(ax):
+    """axis_get_size(ax)
+
+    Args:
+        ax : matplotlib.axes._axes.Axes
+            The axis to be evaluated.
+
+    Returns:
+        tuple : Height and width of the axis in inches.
+    """
+    # Get axis position (relative) and scale it with figure size
+    bbox = ax.get_position()
+    fig_w, fig_h = ax.figure.get_size_inches()
+    ax_h = bbox.height * fig_h
+    ax_w = bbox.width  * fig_w
+    return((ax_h, ax_w))
+
+
+def get_gridsize(axsize, ncol, n):
+    """get_gridsize(axsize, ncol, n)
+
+    Args:
+        axsize : tuple
+            Height and width of the axis (see `axis_get_size()`).
+        ncol : None or int
+            Number of columns. If `None` a (near) quadratic grid
+            is calculated based on the aspect ratio of the axis.
+        n : int
+            Number of grid cells needed.
+
+    Returns:
+        tuple : Number of rows and columns of the grid.
+    """
+    # If 'ncol' is an integer the job is easy
+    if ncol is not None:
+        nrow = int(np.ceil(n / ncol))
+        return nrow, ncol
+    # Else we guess based on the aspect ratio of the axis
+    asp  = float(axsize[1] / axsize[0])
+    nrow = max(1, int(np.round(np.sqrt(n / asp))))
+    ncol = int(np.ceil(n / nrow))
+    return nrow, ncol
 
 
 def pretty_ticks(xmax, n_ticks=4):
@@ -100,9 +205,10 @@ def prepare_num_df(x, labels = True, numeric_only = False):
         list: If no exeption is thrown, a list of length two is returned
         where the first element ('labels') is either `True` or `False`,
         and the second is a (potentially modified) version of the original
-        data DataFrame `x`.
+        data DataFrame `x`. The original object `x` itself is never modified.
     """
     from pandas.api.types import is_numeric_dtype
+    from .stats import log
 
     # Evaluating 'labels'. If 'labels' is string we re-write the index of
     # the data frame and delete the corresponding column from 'x'.
@@ -110,10 +216,16 @@ def prepare_num_df(x, labels = True, numeric_only = False):
         if not labels in x.columns:
             raise ValueError(f"labels = \"{labels}\" invalid, not a column of `x`")
         # Set new index (overwrites existing index and removes column from the data).
-        x.set_index(labels, inplace = True)
-
-    # Check all columns/variables: numeric?
-    isnum = x.apply(is_numeric_dtype).values
+        # On a shallow copy; the data of the user are not modified (nor copied,
+        # unlike set_index() without copy-on-write).
+        from pandas import Index
+        x = x.copy(deep = False)
+        x.index = Index(x[labels])
+        del x[labels]
+
+    # Check all columns/variables: numeric? Based on the dtypes only
+    # (one pass over the columns without touching the data).
+    isnum = np.fromiter((is_numeric_dtype(d) for d in x.dtypes), dtype = bool, count = x.shape[1])
     if not numeric_only and not isnum.all():
         # Very verbal exception to support our students
         if not isinstance(labels, str):
@@ -140,12 +252,12 @@ def prepare_num_df(x, labels = True, numeric_only = False):
         raise Exception(msg)
     elif numeric_only:
         # There will be nothing left after subsetting as all is non-numeric? Well ...
-        print(isnum)
+        log.debug("prepare_num_df(): numeric columns %s", isnum)
         if not isnum.any():
             raise Exception("No numeric columns/variables found in the DataFrame")
 
         # Subsetting the data.frame
-        x = x.iloc[:, isnum]
+        if not isnum.all(): x = x.iloc[:, isnum]
 
 
     # Converting labels to True in case it was str
@@ -0,0 +1,185 @@
+
+import numpy as np
+
+
+class VirtualGrid:
+    """Viewport-Culled Grid of Radar Charts
+
+    Used by `radar(..., virtual = True)`. Keeps the layout (centers) and
+    the (scaled) values of all radar charts but only creates the segments,
+    circles, and labels of the cells inside the current view of the
+    axis (plus a margin). Listens to changes of the axis limits (pan,
+    zoom) and, once before the next draw, updates the artists in-place
+    if the view has left the materialized window, or the window is much
+    larger than needed (e.g., after zooming in); cells far outside the
+    view are discarded. The cost of drawing depends on the number of
+    visible cells only.
+
+    Args:
+        ax (matplotlib.axes._axes.Axes): The axis holding the radar charts.
+        values (numpy.ndarray): Array of shape `(n, k)` with the (scaled) values.
+        centers (numpy.ndarray): Array of shape `(n, 2)` with the centers
+            of the radar charts (integer grid positions).
+        names (list): Labels of the radar charts (str) or `None` (no labels).
+        color (list): Colors of the `k` segments.
+        radius (float): Radius of the segments.
+        xmax (float): Value corresponding to the maximum radius.
+        angle (float): Rotation angle in degrees.
+        step (float): Angular resolution of the arcs (radiant).
+        at (None or list): Values of the reference circles, `None` if no
+            circles should be drawn.
+        ring_labels (bool): Add the values of the circles to each radar chart.
+        fast_labels (bool): Draw the labels as one collection, see `radar()`.
+        circle_n (int): Number of points along each circle.
+        margin (float): Size of the margin around the view (fraction of
+            the size of the view) materialized in advance to avoid updates
+            on small pans.
+
+    Examples:
+
+        >>> import numpy as np
+        >>> import pandas as pd
+        >>> import matplotlib.pyplot as plt
+        >>> from polarchart import radar
+        >>> x  = pd.DataFrame(np.random.uniform(size = (10000, 6)))
+        >>> fig, ax = plt.subplots()
+        >>> radar(x, ax = ax, virtual = True, ring_labels = "legend")
+        >>> ax.set_xlim(-0.5, 5.5); ax.set_ylim(5.5, -0.5)
+        >>> plt.show()
+    """
+
+    def __init__(self, ax, values, centers, names, color, radius, xmax,
+                 angle, step, at = None, ring_labels = False, fast_labels = False,
+                 circle_n = 180, margin = 0.5):
+        from matplotlib.collections import PolyCollection
+        from .radar import get_circle_collection
+
+        self.ax          = ax
+        self.values      = values
+        self.centers     = centers
+        self.names       = names
+        self.color       = color
+        self.radius      = radius
+        self.xmax        = xmax
+        self.angle       = angle
+        self.step        = step
+        self.fast_labels = fast_labels
+        self.margin      = margin
+        self.ncol        = int(centers[:, 0].max()) + 1
+        self.window      = None # Materialized cells (col0, col1, row0, row1)
+        self.index       = np.zeros(0, dtype = int)
+        self._labels     = [] # Label artists of the materialized cells
+
+        self.collection  = PolyCollection([], closed = True, edgecolors = "gray",
+                                          linewidths = 0.5)
+        ax.add_collection(self.collection, autolim = False)
+
+        self.circles, self.ring_labels = None, None
+        if at is not None:
+            self.circles, labels = get_circle_collection(ax, centers[:0], radius = radius,
+                                                         at = at, xmax = xmax, n = circle_n)
+            ax.add_collection(self.circles, autolim = False)
+            if ring_labels: self.ring_labels = labels
+
+        # Changes of the limits only mark the grid as dirty; the cells are
+        # materialized once when the axis is drawn next (e.g., zooming via
+        # set_xlim() and set_ylim() does not materialize the intermediate
+        # view). Strong references (functions) keep this object alive as
+        # long as the axis exists.
+        self._dirty = False
+        ax.callbacks.connect("xlim_changed", lambda ax: self._invalidate())
+        ax.callbacks.connect("ylim_changed", lambda ax: self._invalidate())
+        draw = ax.draw
+        def draw_grid(renderer, *args, **kwargs):
+            if self._dirty: self.update()
+            return draw(renderer, *args, **kwargs)
+        ax.draw = draw_grid
+        self.update()
+
+    def _invalidate(self):
+        """Called on changes of the axis limits"""
+        self._dirty = True
+        self.ax.stale = True
+
+    def _view(self):
+        """Range of columns and rows (cells) of the current view"""
+        (x0, x1), (y0, y1) = sorted(self.ax.get_xlim()), sorted(self.ax.get_ylim())
+        return (int(np.floor(x0 + 0.5)), int(np.ceil(x1 - 0.5)),
+                int(np.floor(y0 + 0.5)), int(np.ceil(y1 - 0.5)))
+
+    def update(self, force = False):
+        """Update the Materialized Cells
+
+        Called before the axis is drawn if the axis limits have changed.
+        Materializes the cells in the current view plus margin if the view
+        is not covered by the current window, or if the window is more
+        than four times larger than needed.
+
+        Args:
+            force (bool): If `True` the cells are materialized in any case.
+        """
+        self._dirty = False
+        c0, c1, r0, r1 = self._view()
+        mx = int(np.ceil((c1 - c0 + 1) * self.margin))
+        my = int(np.ceil((r1 - r0 + 1) * self.margin))
+        if not force and self.window is not None:
+            w0, w1, w2, w3 = self.window
+            inside = w0 <= c0 and c1 <= w1 and w2 <= r0 and r1 <= w3
+            size   = (w1 - w0 + 1) * (w3 - w2 + 1)
+            if inside and size <= 4 * (c1 - c0 + 1 + 2 * mx) * (r1 - r0 + 1 + 2 * my):
+                return
+        self._materialize((c0 - mx, c1 + mx, r0 - my, r1 + my))
+
+    def _materialize(self, window):
+        """Create the artists for all cells inside `window`"""
+        from .geometry import calc_radar_verts
+        from .radar import get_label_collection
+
+        self.window = window
+        c0, c1, r0, r1 = window
+        n    = self.values.shape[0]
+        rows = np.arange(max(0, r0), min(r1, (n - 1) // self.ncol) + 1)
+        cols = np.arange(max(0, c0), min(c1, self.ncol - 1) + 1)
+        idx  = (rows[:, None] * self.ncol + cols[None, :]).ravel()
+        idx  = idx[idx < n]
+        self.index = idx
+
+        k = self.values.shape[1]
+        verts, _ = calc_radar_verts(self.values[idx], self.centers[idx],
+                                    radius = self.radius,
+                                    xmax   = self.xmax,
+                                    angle  = self.angle,
+                                    step   = self.step)
+        self.collection.set_verts(verts.reshape(idx.size * k, -1, 2))
+        self.collection.set_facecolors(self.color[:k] * idx.size)
+        if self.circles is not None:
+            self.circles.set_offsets(self.centers[idx].astype(float))
+
+        # Labels are recreated (clipped to the axis as cells can be
+        # materialized outside the view).
+        for a in self._labels: a.remove()
+        self._labels = []
+        ax = self.ax
+        if self.names is not None and idx.size > 0:
+            va = np.where(idx % 2 == 0, "bottom", "top")
+            if self.fast_labels:
+                coll = get_label_collection(ax, self.centers[idx] + [0, 0.5],
+                                            s = [self.names[i] for i in idx], va = va)
+                coll.set_clip_on(True)
+                self._labels.append(ax.add_collection(coll, autolim = False))
+            else:
+                for i, v in zip(idx, va):
+                    self._labels.append(ax.text(self.centers[i, 0], self.centers[i, 1] + 0.5,
+                                                self.names[i], ha = "center", va = v,
+                                                clip_on = True))
+        if self.ring_labels is not None:
+            for i in idx:
+                x, y = self.centers[i]
+                for s, p in self.ring_labels.items():
+                    self._labels.append(ax.text(x = x + p[0], y = y + p[1], s = s,
+                                                ha = "center", va = "center", color = "gray",
+                                                fontsize = 6, clip_on = True))
+        self.ax.stale = True
+
+    def __repr__(self):
+        return f"VirtualGrid({self.values.shape[0]} charts, {self.index.size} materialized)"
@@ -0,0 +1,133 @@
+
+import os
+import threading
+
+import pytest
+import matplotlib
+matplotlib.use("Agg")
+
+from polarchart import get_demodata, TileRenderer, MemoryCache, DiskCache
+from polarchart.cache import render_key
+
+
+@pytest.fixture
+def gsa():
+    return get_demodata("gsa")
+
+
+# -------------------------------------------------------------------
+# Cache keys
+# -------------------------------------------------------------------
+def test_render_key_data_and_arguments(gsa):
+    key = render_key(gsa, "png")
+    assert key == render_key(gsa.copy(), "png")
+    assert not key == render_key(gsa, "svg")
+    # Same data hash (prefix) for all arguments, see invalidate_data()
+    assert key.split("_")[0] == render_key(gsa, "svg").split("_")[0]
+    assert not key.split("_")[0] == render_key(gsa * 2, "png").split("_")[0]
+
+
+def test_render_key_rcparams(gsa):
+    key = render_key(gsa)
+    with matplotlib.rc_context({"lines.linewidth": 3.}):
+        assert not render_key(gsa) == key
+
+
+def test_tile_key_layout(gsa):
+    # Renderers differing in the grid or the labels only must not share tiles
+    keys = [TileRenderer(gsa, ncol = 3).key, TileRenderer(gsa, ncol = 5).key,
+            TileRenderer(gsa, ncol = 3, labels = False).key]
+    assert len(set(keys)) == 3
+    assert TileRenderer(gsa, ncol = 3).key == keys[0]
+
+
+def test_tile_cache_not_shared(gsa, tmp_path):
+    cache = DiskCache(str(tmp_path))
+    a = TileRenderer(gsa, ncol = 3, cache = cache, tile_size = 64)
+    b = TileRenderer(gsa, ncol = 5, cache = cache, tile_size = 64)
+    assert not a.tile(0, 0) == b.tile(0, 0)
+    assert len(cache) == 2
+
+
+# -------------------------------------------------------------------
+# MemoryCache
+# -------------------------------------------------------------------
+def test_memory_cache_lru():
+    cache = MemoryCache(max_bytes = 10)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    assert cache.get("a") == b"12345" # 'b' is now least recently used
+    cache.put("c", b"12345")
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_memory_cache_invalidate_data(gsa):
+    cache = MemoryCache()
+    cache.put(render_key(gsa, "png"), b"x")
+    cache.put(render_key(gsa, "svg"), b"y")
+    cache.put(render_key(gsa * 2, "png"), b"z")
+    cache.invalidate_data(gsa)
+    assert len(cache) == 1
+
+
+# -------------------------------------------------------------------
+# DiskCache
+# -------------------------------------------------------------------
+def _disk_size(path, suffix = ".png"):
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path)
+               if f.endswith(suffix))
+
+
+def test_disk_cache_get_put(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    assert cache.get("a") is None
+    cache.put("a", b"123")
+    assert cache.get("a") == b"123"
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    with pytest.raises(TypeError):
+        cache.put("a", "123")
+
+
+def test_disk_cache_evict(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes = 10)
+    cache.put("a", b"12345")
+    os.utime(os.path.join(str(tmp_path), "a.png"), (0, 0)) # Least recently used
+    cache.put("b", b"12345")
+    cache.put("c", b"12345")
+    assert cache.get("a") is None
+    assert cache.get("c") == b"12345"
+    assert cache._size == _disk_size(str(tmp_path)) <= 10
+
+
+def test_disk_cache_threads(tmp_path):
+    # Several threads writing the same key (shared temporary files failed)
+    cache  = DiskCache(str(tmp_path), max_bytes = 2**20)
+    errors = []
+    def write(i):
+        try:
+            for _ in range(20):
+                cache.put("same", os.urandom(2**16))
+                cache.put(f"key{i}", os.urandom(2**15))
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target = write, args = (i,)) for i in range(8)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+
+    assert errors == []
+    assert cache._size == _disk_size(str(tmp_path))
+    assert not any(f.endswith(".tmp") for f in os.listdir(str(tmp_path)))
+
+
+def test_disk_cache_entries_removed_externally(tmp_path):
+    cache = DiskCache(str(tmp_path), max_bytes = 10)
+    cache.put("a", b"12345")
+    os.remove(os.path.join(str(tmp_path), "a.png")) # E.g., another process
+    cache.put("b", b"12345")
+    cache.put("c", b"12345")
+    assert cache._size == _disk_size(str(tmp_path))
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,21 @@
+
+import numpy as np
+import pytest
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+
+from polarchart import get_demodata, radar, RadarGeometry
+
+
+@pytest.mark.parametrize("n", [1, 3, 8, 9, 15])
+@pytest.mark.parametrize("ncol", [None, 2])
+def test_from_df_layout(n, ncol):
+    # Same grid as radar() on a square axis (including the legend cell)
+    df = get_demodata("gsa").iloc[:n]
+    ax = Figure(figsize = (6, 6)).subplots()
+    radar(df, ax = ax, ncol = ncol)
+    cols = int(ax.get_xlim()[1] + 0.5)
+    idx  = np.arange(n)
+    geom = RadarGeometry.from_df(df, ncol = ncol)
+    assert np.array_equal(geom.centers, np.column_stack([idx % cols, idx // cols]))
@@ -0,0 +1,40 @@
+
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Statement and modules which must not be loaded afterwards
+CHECKS = [("import polarchart",                     ["numpy", "pandas", "matplotlib", "colorspace"]),
+          ("from polarchart import get_demodata",   ["matplotlib", "colorspace"]),
+          ("from polarchart import radar",          ["matplotlib.pyplot", "colorspace"]),
+          ("from polarchart import RadarGeometry",  ["pandas", "matplotlib", "colorspace"]),
+          ("from polarchart import MemoryCache",    ["numpy", "pandas", "matplotlib"]),
+          ("from polarchart import AsyncRenderer",  ["numpy", "pandas", "matplotlib"])]
+
+
+def loaded_modules(stmt):
+    """Executes `stmt` in a fresh interpreter; returns `sys.modules`"""
+    script = f"import sys, json\nsys.path.insert(0, {ROOT!r})\n{stmt}\nprint(json.dumps(list(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", script], capture_output = True,
+                         text = True, check = True).stdout
+    return set(json.loads(out))
+
+
+@pytest.mark.parametrize("stmt,forbidden", CHECKS)
+def test_lazy_import(stmt, forbidden):
+    modules = loaded_modules(stmt)
+    assert [m for m in forbidden if m in modules] == []
+
+
+def test_lazy_attributes():
+    import polarchart
+    import polarchart.radar # Binds the submodule to the package
+    assert callable(polarchart.radar) and polarchart.radar.__name__ == "radar"
+    assert set(polarchart.__all__) <= set(dir(polarchart))
+    with pytest.raises(AttributeError):
+        polarchart.does_not_exist
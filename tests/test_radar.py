@@ -0,0 +1,26 @@
+
+import pytest
+import matplotlib
+matplotlib.use("Agg")
+
+from polarchart import get_demodata, radar
+
+
+@pytest.fixture
+def gsa():
+    return get_demodata("gsa")
+
+
+def test_color(gsa):
+    k = gsa.select_dtypes("number").shape[1]
+    radar(gsa, output = "figure", color = ["red"] * k)
+    with pytest.raises(ValueError, match = "one color per column"):
+        radar(gsa, output = "figure", color = ["red"] * (k - 1))
+
+
+def test_ring_labels(gsa):
+    radar(gsa, output = "figure", ring_labels = "legend")
+    with pytest.raises(TypeError):
+        radar(gsa, output = "figure", ring_labels = 1)
+    with pytest.raises(ValueError):
+        radar(gsa, output = "figure", ring_labels = "inside")
@@ -0,0 +1,32 @@
+
+import inspect
+
+import pytest
+import matplotlib
+matplotlib.use("Agg")
+
+from polarchart import get_demodata, radar_summary
+
+
+@pytest.fixture
+def gsa():
+    return get_demodata("gsa")
+
+
+def test_dpi(gsa):
+    png = radar_summary(gsa, groups = 2, seed = 1, output = "png", dpi = 50)
+    assert png[:8] == b"\x89PNG\r\n\x1a\n"
+    with pytest.raises(TypeError):
+        radar_summary(gsa, output = "png", dpi = 50.)
+    with pytest.raises(ValueError):
+        radar_summary(gsa, output = "png", dpi = 0)
+
+
+def test_envelope(gsa):
+    # Immutable default
+    default = inspect.signature(radar_summary).parameters["envelope"].default
+    assert default == ((0., 1.), (0.25, 0.75))
+    with pytest.raises(TypeError):
+        radar_summary(gsa, envelope = [[0., 1.]])
+    with pytest.raises(ValueError):
+        radar_summary(gsa, envelope = [(0.75, 0.25)])
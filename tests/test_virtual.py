@@ -0,0 +1,35 @@
+
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from polarchart import radar
+from polarchart.virtual import VirtualGrid
+
+
+def test_update_once_per_draw(monkeypatch):
+    windows = []
+    materialize = VirtualGrid._materialize
+    def record(self, window):
+        windows.append(window)
+        materialize(self, window)
+    monkeypatch.setattr(VirtualGrid, "_materialize", record)
+
+    df = pd.DataFrame(np.random.default_rng(1).random((2000, 5)))
+    fig, ax = plt.subplots()
+    radar(df, ax = ax, virtual = True, labels = False, ring_labels = False)
+    assert len(windows) == 1
+    fig.canvas.draw()
+    assert len(windows) == 1
+
+    # Zooming (both limits) materializes the final view only, when drawn
+    ax.set_xlim(10, 20)
+    ax.set_ylim(30, 40)
+    assert len(windows) == 1
+    fig.canvas.draw()
+    assert windows[1:] == [(4, 26, 24, 46)]
+    fig.canvas.draw()
+    assert len(windows) == 2
+    plt.close(fig)